@@ -0,0 +1,58 @@
+"""
+_script_cache.py
+
+Caches the head revision of the script directory on disk so that env.py can
+learn it without importing every file under `versions/`.
+
+The cache is keyed by the names and mtimes of the revision files; adding,
+removing or editing a revision invalidates it and the head is recomputed
+with Alembic's own `ScriptDirectory`.
+"""
+
+import json
+import os
+
+from alembic.script import ScriptDirectory
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "script_head.json")
+
+
+def _versions_key(versions_dir):
+    entries = sorted(
+        (name, os.stat(os.path.join(versions_dir, name)).st_mtime_ns)
+        for name in os.listdir(versions_dir)
+        if name.endswith(".py")
+    )
+    return [list(entry) for entry in entries]
+
+
+def current_head(config):
+    """
+    Return the head revision for `config`, using the on-disk cache when valid.
+
+    Args:
+        config (Config): The Alembic config of the running command.
+
+    Returns:
+        str: The current head revision id.
+    """
+    # Resolved the same way ScriptDirectory does: relative to the cwd
+    versions_dir = os.path.join(config.get_main_option("script_location"), "versions")
+    key = _versions_key(versions_dir)
+
+    try:
+        with open(CACHE_PATH) as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["head"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    head = ScriptDirectory.from_config(config).get_current_head()
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, "w") as f:
+            json.dump({"key": key, "head": head}, f)
+    except OSError:
+        pass
+    return head
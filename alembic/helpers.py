@@ -0,0 +1,110 @@
+"""
+helpers.py
+
+Shared helpers for Alembic revision scripts.
+
+Data-touching migration steps (backfills, type conversions done via a shadow
+column) should go through `paged_update` rather than a single UPDATE over the
+whole table, so that each batch runs in its own short transaction and the
+table is never locked for the full rewrite window.
+"""
+
+import logging
+import os
+
+import sqlalchemy as sa
+from alembic import op
+
+logger = logging.getLogger("alembic.helpers")
+
+DEFAULT_BATCH_SIZE = int(os.environ.get("BATCH_SIZE", 200))
+
+
+def paged_update(table, pk, setter_sql, where_sql, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Apply an UPDATE to `table` in committed batches of `batch_size` rows.
+
+    Each batch selects up to `batch_size` rows matching `where_sql` by `pk` and
+    applies `setter_sql` to them. Batches run in autocommit mode, so every batch
+    is its own transaction; `where_sql` must stop matching a row once it has
+    been updated or the loop will not terminate. In offline (`--sql`) mode a
+    single unbatched UPDATE is emitted instead.
+
+    Args:
+        table (str): Name of the table to update.
+        pk (str): Column used to address rows in a batch (e.g. "ctid").
+        setter_sql (str): SQL for the SET clause, e.g. "id_new = id::uuid".
+        where_sql (str): SQL predicate selecting rows still to be updated.
+        batch_size (int): Rows per batch. Defaults to the BATCH_SIZE env var or 200.
+
+    Returns:
+        int: Total number of rows updated.
+    """
+    if op.get_context().as_sql:
+        # Offline (--sql) mode cannot read row counts back; emit one UPDATE
+        op.execute(f"UPDATE {table} SET {setter_sql} WHERE {where_sql}")
+        return 0
+
+    conn = op.get_bind()
+    total = conn.execute(
+        sa.text(f"SELECT count(*) FROM {table} WHERE {where_sql}")
+    ).scalar()
+    stmt = sa.text(
+        f"UPDATE {table} SET {setter_sql} "
+        f"WHERE {pk} IN (SELECT {pk} FROM {table} WHERE {where_sql} LIMIT :batch)"
+    )
+
+    done = 0
+    with op.get_context().autocommit_block():
+        while True:
+            updated = conn.execute(stmt, {"batch": batch_size}).rowcount
+            if not updated:
+                break
+            done += updated
+            logger.info("%s: updated %d/%d rows", table, done, total)
+
+    return done
+
+
+# Set by the baseline revision when it creates the table in this run; the
+# only signal available in offline (--sql) mode, where nothing can be inspected
+_baseline_created = False
+
+
+def mark_baseline_created():
+    """Record that the baseline revision created the users table in this run."""
+    global _baseline_created
+    _baseline_created = True
+
+
+def users_table_exists():
+    """
+    Return True if the users table already exists (always False offline).
+
+    Returns:
+        bool: Whether `users` exists in the connected database.
+    """
+    if op.get_context().as_sql:
+        return False
+    return sa.inspect(op.get_bind()).has_table("users")
+
+
+def baseline_applied():
+    """
+    Return True if the users table was created by the squashed baseline revision.
+
+    The baseline creates `users` with every column up to and including
+    `firecrawl_api_key`, which no pre-baseline database has until the final
+    historical revision. Historical revisions call this first and return early
+    so a fresh database is set up with a single CREATE TABLE.
+
+    Returns:
+        bool: Whether the historical ALTERs can be skipped.
+    """
+    if _baseline_created or op.get_context().as_sql:
+        return _baseline_created
+
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("users"):
+        return False
+    return any(c["name"] == "firecrawl_api_key" for c in inspector.get_columns("users"))
@@ -5,8 +5,8 @@ Revises: 20250501_add_tavily_api_key
 Create Date: 2025-05-19 18:00:00.000000
 """
 from alembic import op
-import sqlalchemy as sa
-import sqlalchemy.dialects.postgresql as pg
+
+from helpers import baseline_applied, paged_update
 
 # revision identifiers, used by Alembic.
 revision = "20250519_add_fastapi_users_columns"
@@ -15,57 +15,52 @@ branch_labels = None
 depends_on = None
 
 def upgrade():
-    # Enable uuid-ossp extension so uuid_generate_v4() exists:
-    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
+    if baseline_applied():
+        return
 
-    # Convert id from VARCHAR to native UUID, generating new values:
-    op.alter_column(
-        "users", "id",
-        existing_type=sa.String(length=64),
-        type_=pg.UUID(),
-        postgresql_using="uuid_generate_v4()",
-        existing_nullable=False,
+    # Add the FastAPI-Users boolean flags plus a shadow uuid column in one
+    # ALTER TABLE. Constant defaults (and a nullable column without default)
+    # are metadata-only, so this does not rewrite the table.
+    op.execute(
+        """
+        ALTER TABLE users
+            ADD COLUMN id_new uuid,
+            ADD COLUMN is_active boolean NOT NULL DEFAULT true,
+            ADD COLUMN is_superuser boolean NOT NULL DEFAULT false,
+            ADD COLUMN is_verified boolean NOT NULL DEFAULT false
+        """
     )
 
-    # Add only the missing FastAPI-Users boolean flags:
-    op.add_column(
-        "users",
-        sa.Column(
-            "is_active",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.sql.expression.true(),
-        ),
-    )
-    op.add_column(
+    # Backfill the shadow column in small committed batches. UUID-shaped ids
+    # are cast in place; legacy ids that cannot be cast get a fresh
+    # server-generated UUID (core gen_random_uuid(), PG13+).
+    paged_update(
         "users",
-        sa.Column(
-            "is_superuser",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.sql.expression.false(),
-        ),
-    )
-    op.add_column(
-        "users",
-        sa.Column(
-            "is_verified",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.sql.expression.false(),
-        ),
+        "ctid",
+        """
+        id_new = CASE
+            WHEN id ~* '^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$'
+            THEN id::uuid
+            ELSE gen_random_uuid()
+        END
+        """,
+        "id_new IS NULL",
     )
 
-def downgrade():
-    # Drop the flags in reverse order
-    op.drop_column("users", "is_verified")
-    op.drop_column("users", "is_superuser")
-    op.drop_column("users", "is_active")
+    # Swap the shadow column in; dropping id also drops users_pkey.
+    op.execute("ALTER TABLE users DROP COLUMN id")
+    op.execute("ALTER TABLE users RENAME COLUMN id_new TO id")
+    op.execute("ALTER TABLE users ADD PRIMARY KEY (id)")
 
-    # Convert id back to a 64-char string (you may lose data here if you’d actually converted to real UUIDs)
-    op.alter_column(
-        "users", "id",
-        existing_type=pg.UUID(),
-        type_=sa.String(length=64),
-        existing_nullable=False,
+def downgrade():
+    # Drop the flags and convert id back to a 64-char string in a single
+    # ALTER TABLE (you may lose data here if you’d actually converted to real UUIDs)
+    op.execute(
+        """
+        ALTER TABLE users
+            DROP COLUMN is_verified,
+            DROP COLUMN is_superuser,
+            DROP COLUMN is_active,
+            ALTER COLUMN id TYPE varchar(64) USING id::text
+        """
     )
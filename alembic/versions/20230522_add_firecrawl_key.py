@@ -7,6 +7,8 @@ Create Date: 2025-05-22 18:00:00.000000
 from alembic import op
 import sqlalchemy as sa
 
+from helpers import baseline_applied
+
 # revision identifiers, used by Alembic.
 revision = "20250522_add_firecrawl_api_key"
 down_revision = "361ff68b3b4f"
@@ -15,6 +17,9 @@ depends_on = None
 
 
 def upgrade():
+    if baseline_applied():
+        return
+
     # Add the new API key column (nullable so existing rows continue to work)
     op.add_column(
         "users",
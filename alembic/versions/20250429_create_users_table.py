@@ -1,20 +1,25 @@
 """create users table
 
 Revision ID: 20250429_create_users_table
-Revises: 
+Revises: 20250601_baseline_users
 Create Date: 2025-04-29 20:30:00.000000
 
 """
 from alembic import op
 import sqlalchemy as sa
 
+from helpers import baseline_applied
+
 # revision identifiers, used by Alembic.
 revision = "20250429_create_users_table"
-down_revision = None
+down_revision = "20250601_baseline_users"
 branch_labels = None
 depends_on = None
 
 def upgrade():
+    if baseline_applied():
+        return
+
     op.create_table(
         "users",
         sa.Column("id", sa.String(length=64), primary_key=True),
@@ -8,6 +8,8 @@ Create Date: 2025-05-02 10:00:00.000000
 from alembic import op
 import sqlalchemy as sa
 
+from helpers import baseline_applied
+
 # revision identifiers, used by Alembic.
 revision = '20250501_add_tavily_api_key'
 down_revision = '20250430_add_openai_api_key'
@@ -15,9 +17,12 @@ branch_labels = None
 depends_on = None
 
 def upgrade():
+    if baseline_applied():
+        return
+
     op.add_column(
         'users',
-        sa.Column('tavily_api_key', sa.String(), nullable=True),
+        sa.Column('tavily_api_key', sa.String(length=255), nullable=True),
     )
 
 def downgrade():
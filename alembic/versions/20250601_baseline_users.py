@@ -0,0 +1,52 @@
+"""Baseline users table
+
+Creates the `users` table in its final shape in a single CREATE TABLE so a
+fresh database does not replay the historical ALTERs. The historical
+revisions now sit on top of this one and return early when they detect a
+baseline-created table (see `helpers.baseline_applied`); databases that
+were already migrated are unaffected.
+
+Revision ID: 20250601_baseline_users
+Revises: 
+Create Date: 2025-06-01 09:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+from helpers import mark_baseline_created, users_table_exists
+
+# revision identifiers, used by Alembic.
+revision = "20250601_baseline_users"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if users_table_exists():
+        # Pre-baseline database; the historical revisions own this table.
+        return
+
+    op.create_table(
+        "users",
+        sa.Column("id", pg.UUID(), primary_key=True),
+        sa.Column("email", sa.String(length=320), nullable=False),
+        sa.Column("hashed_password", sa.String(length=1024), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.text("true")),
+        sa.Column("is_superuser", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("is_verified", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("salt", sa.String(length=32), nullable=False),
+        sa.Column("openai_api_key", sa.String(length=255), nullable=True),
+        sa.Column("tavily_api_key", sa.String(length=255), nullable=True),
+        sa.Column("firecrawl_api_key", sa.String(length=512), nullable=True),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    mark_baseline_created()
+
+def downgrade():
+    if op.get_context().as_sql:
+        # Offline there is no way to tell which chain created the table; when the historical
+        # revisions ran first, 20250429's downgrade has already emitted its DROP TABLE.
+        op.execute("DROP TABLE IF EXISTS users")
+    elif users_table_exists():
+        op.drop_table("users")
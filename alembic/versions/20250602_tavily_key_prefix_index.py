@@ -0,0 +1,30 @@
+"""Bound tavily_api_key length
+
+The revision id predates a dropped plan to also index substr(tavily_api_key, 1, 16):
+no code looks keys up by prefix, so such an index would only add write overhead.
+
+Revision ID: 20250602_tavily_key_prefix_index
+Revises: 20250522_add_firecrawl_api_key
+Create Date: 2025-06-02 09:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20250602_tavily_key_prefix_index"
+down_revision = "20250522_add_firecrawl_api_key"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Databases created before the column was bounded still have it as TEXT
+    op.alter_column(
+        "users", "tavily_api_key",
+        existing_type=sa.String(),
+        type_=sa.String(length=255),
+        existing_nullable=True,
+    )
+
+def downgrade():
+    # The bounded length matches 20250501 / the baseline, so there is nothing to undo
+    pass
@@ -0,0 +1,26 @@
+"""Index users on (is_active, id) for keyset-paginated admin listings
+
+Revision ID: 20250603_users_active_id_index
+Revises: 20250602_tavily_key_prefix_index
+Create Date: 2025-06-03 09:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250603_users_active_id_index"
+down_revision = "20250602_tavily_key_prefix_index"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Lets /admin/pending walk pending users in id order with an index scan;
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_is_active_id "
+            "ON users (is_active, id)"
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_is_active_id")
@@ -0,0 +1,32 @@
+"""Replace the (is_active, id) index with a partial index on pending users
+
+Revision ID: 20250604_users_pending_partial_index
+Revises: 20250603_users_active_id_index
+Create Date: 2025-06-04 09:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250604_users_pending_partial_index"
+down_revision = "20250603_users_active_id_index"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # /admin/pending only ever reads is_active = false; a partial index on id holds just
+    # those rows, so it stays tiny while still serving the keyset pagination order.
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_pending "
+            "ON users (id) WHERE is_active = false"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_is_active_id")
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_is_active_id "
+            "ON users (is_active, id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_pending")
@@ -0,0 +1,27 @@
+"""Add an expression index on lower(email) for case-insensitive login lookups
+
+Revision ID: 20250605_users_email_lower_index
+Revises: 20250604_users_pending_partial_index
+Create Date: 2025-06-05 09:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250605_users_email_lower_index"
+down_revision = "20250604_users_pending_partial_index"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # fastapi-users' get_by_email filters on lower(email) = lower(:email); the unique index on
+    # email cannot serve that predicate, so every login was a sequential scan of users.
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower "
+            "ON users (lower(email))"
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
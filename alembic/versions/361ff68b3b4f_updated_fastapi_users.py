@@ -11,6 +11,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from helpers import baseline_applied
+
 # revision identifiers, used by Alembic.
 revision: str = '361ff68b3b4f'
 down_revision: Union[str, None] = '20250519_add_fastapi_users_columns'
@@ -20,6 +22,9 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
+    if baseline_applied():
+        return
+
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table('users', schema=None) as batch_op:
         batch_op.alter_column('email',
@@ -0,0 +1,38 @@
+import os
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _find(name=".env"):
+    # Walk up from scripts/ like python-dotenv's find_dotenv does
+    path = SCRIPTS_DIR
+    while True:
+        candidate = os.path.join(path, name)
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def load(path=None, override=False):
+    """Parse simple KEY=value lines from .env into os.environ and return them as a dict."""
+    path = path or _find()
+    values = {}
+    if not path:
+        return values
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            key = key.removeprefix("export ").strip()
+            values[key] = value.strip().strip('"').strip("'")
+
+    for key, value in values.items():
+        if override or key not in os.environ:
+            os.environ[key] = value
+    return values
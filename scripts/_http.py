@@ -0,0 +1,45 @@
+import time
+
+import httpx
+import orjson
+
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "POST", "PATCH"})
+RETRY_TOTAL = 3
+BACKOFF_FACTOR = 0.3
+
+
+class _RetryTransport(httpx.HTTPTransport):
+    # Connection errors are retried by the base transport (retries=...);
+    # this adds retries with exponential backoff on transient 5xx replies.
+    def handle_request(self, request):
+        response = super().handle_request(request)
+        for attempt in range(RETRY_TOTAL):
+            if response.status_code not in RETRY_STATUSES or request.method not in RETRY_METHODS:
+                break
+            response.close()
+            time.sleep(BACKOFF_FACTOR * (2 ** attempt))
+            response = super().handle_request(request)
+        return response
+
+
+def make_client(api_base):
+    """Build the HTTP/2 client shared by every request a script makes."""
+    return httpx.Client(
+        base_url=api_base,
+        timeout=30.0,
+        headers={"Accept": "application/json"},
+        transport=_RetryTransport(http2=True, retries=RETRY_TOTAL),
+    )
+
+
+def read_json(label, resp, echo=True):
+    """Decode a JSON response body, printing it (or the raw text) under `label`."""
+    try:
+        body = orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        print(f"{label} BODY (raw):", repr(resp.text))
+        return None
+    if echo:
+        print(f"{label} BODY:", body)
+    return body
@@ -0,0 +1,74 @@
+import base64
+import os
+import sys
+import tempfile
+import time
+
+import orjson
+
+CACHE_PATH = os.path.expanduser("~/.cache/llm_app_template/token.json")
+
+# Re-login if the cached token expires within this many seconds
+EXPIRY_MARGIN = 30
+
+
+def _token_exp(token):
+    # Read the exp claim without verifying the signature; the server does that
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return orjson.loads(base64.urlsafe_b64decode(payload)).get("exp", 0)
+    except (IndexError, ValueError):
+        return 0
+
+
+def _read_cache():
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache):
+    cache_dir = os.path.dirname(CACHE_PATH)
+    os.makedirs(cache_dir, exist_ok=True)
+    # mkstemp creates the file 0600, so the tokens are never readable by others, even briefly;
+    # os.replace swaps it in atomically and also replaces an older, looser-permissioned file
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".token-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(cache))
+        os.replace(tmp_path, CACHE_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_token(client, email, password):
+    """Return a JWT for `email`, reusing the cached one until it is about to expire."""
+    key = f"{client.base_url}|{email}"
+    cache = _read_cache()
+
+    token = cache.get(key)
+    if token and _token_exp(token) > time.time() + EXPIRY_MARGIN:
+        return token
+
+    login = client.post(
+        "/auth/jwt/login",
+        data={"username": email, "password": password},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    print("LOGIN ➤", login.status_code)
+    if login.is_error:
+        print("LOGIN BODY (raw):", repr(login.text))
+    login.raise_for_status()
+
+    token = orjson.loads(login.content).get("access_token")
+    if not token:
+        print("❌ No access_token in login response!", file=sys.stderr)
+        sys.exit(1)
+
+    cache[key] = token
+    _write_cache(cache)
+    return token
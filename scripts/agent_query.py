@@ -1,11 +1,13 @@
 import os
 import sys
-import requests
-from dotenv import load_dotenv
-from requests.exceptions import JSONDecodeError
+import orjson
+
+import _env
+from _http import make_client, read_json
+from _token_cache import get_token
 
 # Load .env
-load_dotenv(override=True)
+_env.load(override=True)
 
 API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
 EMAIL    = os.getenv("USER_EMAIL")
@@ -16,39 +18,21 @@ if not EMAIL or not PASSWORD:
     print("❌ Set USER_EMAIL and USER_PASSWORD in .env", file=sys.stderr)
     sys.exit(1)
 
-# 1) Get JWT
-login = requests.post(
-    f"{API_BASE}/auth/jwt/login",
-    data={"username": EMAIL, "password": PASSWORD},
-    headers={"Content-Type": "application/x-www-form-urlencoded", "Accept": "application/json"},
-)
-print("LOGIN ➤", login.status_code)
-try:
-    j = login.json(); print("LOGIN BODY:", j)
-except JSONDecodeError:
-    print("LOGIN BODY (raw):", repr(login.text))
-login.raise_for_status()
-
-token = j.get("access_token")
-if not token:
-    print("❌ No access_token!", file=sys.stderr)
-    sys.exit(1)
+with make_client(API_BASE) as client:
+    # 1) Get JWT (cached between runs)
+    token = get_token(client, EMAIL, PASSWORD)
 
-# 2) Call /agent/ask
-resp = requests.post(
-    f"{API_BASE}/agent/ask",
-    json={"query": QUERY},
-    headers={
-        "Authorization": f"Bearer {token}",
-        "Content-Type":  "application/json",
-        "Accept":        "application/json",
-    },
-)
-print("AGENT ➤", resp.status_code)
-try:
-    aj = resp.json(); # print("AGENT BODY:", aj)
-except JSONDecodeError:
-    print("AGENT BODY (raw):", repr(resp.text))
-resp.raise_for_status()
+    # 2) Call /agent/ask
+    resp = client.post(
+        "/agent/ask",
+        content=orjson.dumps({"query": QUERY}),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type":  "application/json",
+        },
+    )
+    print("AGENT ➤", resp.status_code)
+    aj = read_json("AGENT", resp, echo=False)
+    resp.raise_for_status()
 
-print("Agent says:", aj.get("response"))
\ No newline at end of file
+    print("Agent says:", aj.get("response"))
@@ -1,11 +1,12 @@
 import os
 import sys
-import requests
-from dotenv import load_dotenv
-from requests.exceptions import JSONDecodeError
+import orjson
+
+import _env
+from _http import make_client, read_json
 
 # Load .env
-load_dotenv(override=True)
+_env.load(override=True)
 
 API_BASE        = os.getenv("API_BASE_URL", "http://localhost:8000")
 EMAIL           = os.getenv("USER_EMAIL")
@@ -26,14 +27,12 @@ if OPENAI_API_KEY:
 if TAVILY_API_KEY:
     payload["tavily_api_key"] = TAVILY_API_KEY
 
-resp = requests.post(
-    f"{API_BASE}/auth/register",
-    json=payload,
-    headers={"Content-Type": "application/json"},
-)
-print("REGISTER ➤", resp.status_code)
-try:
-    body = resp.json(); print("REGISTER BODY:", body)
-except JSONDecodeError:
-    print("REGISTER BODY (raw):", repr(resp.text))
-resp.raise_for_status()
+with make_client(API_BASE) as client:
+    resp = client.post(
+        "/auth/register",
+        content=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+    )
+    print("REGISTER ➤", resp.status_code)
+    body = read_json("REGISTER", resp)
+    resp.raise_for_status()
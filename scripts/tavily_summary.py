@@ -1,10 +1,12 @@
 import os
 import sys
-import requests
-from dotenv import load_dotenv
-from requests.exceptions import JSONDecodeError
+import orjson
 
-load_dotenv(override=True)
+import _env
+from _http import make_client, read_json
+from _token_cache import get_token
+
+_env.load(override=True)
 
 # Point to your local server by default
 API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
@@ -19,48 +21,26 @@ if not EMAIL or not PASSWORD:
     print("❌ Please set USER_EMAIL and USER_PASSWORD in your .env", file=sys.stderr)
     sys.exit(1)
 
-# 1) Authenticate
-login = requests.post(
-    f"{API_BASE}/auth/jwt/login",
-    data={"username": EMAIL, "password": PASSWORD},
-    headers={
-        "Content-Type": "application/x-www-form-urlencoded",
-        "Accept":       "application/json",
-    },
-)
-print("LOGIN   ➤", login.status_code)
-try:
-    body = login.json()
-    print("LOGIN BODY:", body)
-except JSONDecodeError:
-    print("LOGIN BODY (raw):", repr(login.text))
-login.raise_for_status()
-
-token = body.get("access_token")
-if not token:
-    print("❌ No access_token in login response!", file=sys.stderr)
-    sys.exit(1)
-
-# 2) Call /tavily/summarize
-payload = {
-    "query": QUERY,
-    "top_k": TOP_K,
-}
-
-resp = requests.post(
-    f"{API_BASE}/tavily/summarize",
-    json=payload,
-    headers={
-        "Authorization": f"Bearer {token}",
-        "Content-Type":  "application/json",
-        "Accept":        "application/json",
-    },
-)
-print("SUMMARIZE ➤", resp.status_code)
-try:
-    print("SUMMARIZE BODY:", resp.json())
-except JSONDecodeError:
-    print("SUMMARIZE BODY (raw):", repr(resp.text))
-
-if resp.status_code >= 400:
-    sys.exit(1)
\ No newline at end of file
+with make_client(API_BASE) as client:
+    # 1) Authenticate (token cached between runs)
+    token = get_token(client, EMAIL, PASSWORD)
+
+    # 2) Call /tavily/summarize
+    payload = {
+        "query": QUERY,
+        "top_k": TOP_K,
+    }
+
+    resp = client.post(
+        "/tavily/summarize",
+        content=orjson.dumps(payload),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type":  "application/json",
+        },
+    )
+    print("SUMMARIZE ➤", resp.status_code)
+    read_json("SUMMARIZE", resp)
+
+    if resp.status_code >= 400:
+        sys.exit(1)
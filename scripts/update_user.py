@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 import os, sys
-import requests
-from dotenv import load_dotenv
-from requests.exceptions import JSONDecodeError
+import orjson
+
+import _env
+from _http import make_client, read_json
+from _token_cache import get_token
 
 # 1) Load .env (override any existing values so our .env keys actually take effect)
-load_dotenv(override=True)
+_env.load(override=True)
 
 API_BASE       = os.getenv("API_BASE_URL", "https://api.macdonml.com")
 EMAIL          = os.getenv("USER_EMAIL")
@@ -20,44 +22,26 @@ if not EMAIL or not PASSWORD:
 
 print("🔑 OpenAI key loaded:", OPENAI_KEY)
 
-# 2) Log in—hit the FastAPI-Users JWT login endpoint, not /token
-login = requests.post(
-    f"{API_BASE}/auth/jwt/login",
-    data={"username": EMAIL, "password": PASSWORD},
-    headers={"Content-Type": "application/x-www-form-urlencoded"},
-)
-print("LOGIN ➤", login.status_code)
-try:
-    login_data = login.json()
-    print("LOGIN BODY:", login_data)
-except JSONDecodeError:
-    print("LOGIN BODY (raw):", repr(login.text))
-login.raise_for_status()
-
-token = login_data.get("access_token")
-if not token:
-    print("❌ No access_token in login response!", file=sys.stderr)
-    sys.exit(1)
+with make_client(API_BASE) as client:
+    # 2) Log in—hit the FastAPI-Users JWT login endpoint, not /token
+    token = get_token(client, EMAIL, PASSWORD)
 
-# 3) PATCH /users/me with your new API keys
-payload = {
-    "email":              EMAIL,
-    "password":           PASSWORD,
-    "openai_api_key":     OPENAI_KEY,
-    "tavily_api_key":     TAVILY_KEY,
-    "firecrawl_api_key":  FIRECRAWL_KEY,
-}
-patch = requests.patch(
-    f"{API_BASE}/users/me",
-    json=payload,
-    headers={
-        "Authorization": f"Bearer {token}",
-        "Content-Type":  "application/json",
-    },
-)
-print("PATCH ➤", patch.status_code)
-try:
-    print("PATCH BODY:", patch.json())
-except JSONDecodeError:
-    print("PATCH BODY (raw):", repr(patch.text))
-patch.raise_for_status()
+    # 3) PATCH /users/me with your new API keys
+    payload = {
+        "email":              EMAIL,
+        "password":           PASSWORD,
+        "openai_api_key":     OPENAI_KEY,
+        "tavily_api_key":     TAVILY_KEY,
+        "firecrawl_api_key":  FIRECRAWL_KEY,
+    }
+    patch = client.patch(
+        "/users/me",
+        content=orjson.dumps(payload),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type":  "application/json",
+        },
+    )
+    print("PATCH ➤", patch.status_code)
+    read_json("PATCH", patch)
+    patch.raise_for_status()
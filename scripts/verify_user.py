@@ -1,11 +1,12 @@
 import os
 import sys
-import requests
-from dotenv import load_dotenv
-from requests.exceptions import JSONDecodeError
+
+import _env
+from _http import make_client, read_json
+from _token_cache import get_token
 
 # Load .env
-load_dotenv(override=True)
+_env.load(override=True)
 
 API_BASE        = os.getenv("API_BASE_URL",    "http://localhost:8000")
 ADMIN_EMAIL     = os.getenv("ADMIN_EMAIL")
@@ -16,35 +17,18 @@ if not (ADMIN_EMAIL and ADMIN_PASSWORD and USER_ID):
     print("❌ Set ADMIN_EMAIL, ADMIN_PASSWORD and USER_ID_TO_VERIFY in .env", file=sys.stderr)
     sys.exit(1)
 
-# 1) Login as superuser to get JWT
-login = requests.post(
-    f"{API_BASE}/auth/jwt/login",
-    data={"username": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
-    headers={"Content-Type": "application/x-www-form-urlencoded"},
-)
-print("LOGIN  ➤", login.status_code)
-try:
-    lj = login.json(); print("LOGIN BODY:", lj)
-except JSONDecodeError:
-    print("LOGIN BODY (raw):", repr(login.text))
-login.raise_for_status()
-
-token = lj.get("access_token")
-if not token:
-    print("❌ No access_token returned!", file=sys.stderr)
-    sys.exit(1)
+with make_client(API_BASE) as client:
+    # 1) Login as superuser to get JWT (cached between runs)
+    token = get_token(client, ADMIN_EMAIL, ADMIN_PASSWORD)
 
-# 2) Verify the user
-resp = requests.post(
-    f"{API_BASE}/admin/verify/{USER_ID}",
-    headers={
-        "Authorization": f"Bearer {token}",
-        "Content-Type":  "application/json",
-    },
-)
-print("VERIFY ➤", resp.status_code)
-try:
-    vj = resp.json(); print("VERIFY BODY:", vj)
-except JSONDecodeError:
-    print("VERIFY BODY (raw):", repr(resp.text))
-resp.raise_for_status()
+    # 2) Verify the user
+    resp = client.post(
+        f"/admin/verify/{USER_ID}",
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type":  "application/json",
+        },
+    )
+    print("VERIFY ➤", resp.status_code)
+    vj = read_json("VERIFY", resp)
+    resp.raise_for_status()
@@ -10,6 +10,10 @@ Key Features:
 - Integrates with the OpenAI API for LLM-backed conversational agent tasks.
 - Supports dynamic, tool-augmented agent workflows using external MCP (Model Context Protocol) servers 
   via Server-Sent Events (SSE) for real-time tool invocation and results aggregation.
+- Identical concurrent `ask` calls share one agent run, but only between callers with the same OpenAI key
+  and the same (pooled) MCP servers, so no user's run is served with another user's credentials.
+- Streams the final answer token by token (`stream`) via `Runner.run_streamed`, so clients receive the
+  first tokens without waiting for the whole generation; `ask` collects the same stream.
 - Designed as an implementation of the AgentPort interface, making it easy to inject and substitute in 
   FastAPI applications via dependency injection.
 - Clean abstraction suitable for use in boundary adapters, anti-corruption layers, or orchestrators 
@@ -32,6 +36,8 @@ Example:
         model="gpt-4o-mini"
     )
     response = await adapter.ask("What is the weather today?")
+    async for token in adapter.stream("What is the weather today?"):
+        print(token, end="")
 
 Dependencies:
 -------------
@@ -41,17 +47,23 @@ Dependencies:
 
 Classes:
 --------
-- AgentsAdapter: Adapter implementing AgentPort, exposing a coroutine to process queries 
-  via a unified conversational agent.
+- AgentsAdapter: Adapter implementing AgentPort, exposing a coroutine and a token stream to
+  process queries via a unified conversational agent.
 
 """
 
+import hashlib
 import openai
-from typing import List
+from typing import AsyncIterator, List
 from agents import Agent, Runner
+from openai.types.responses import ResponseTextDeltaEvent
 from agents.mcp import MCPServerSse
+from app.batching import RequestCoalescer
 from app.ports.agent_port import AgentPort
 
+# Shared across adapter instances, which are built per request
+_inflight_asks = RequestCoalescer()
+
 class AgentsAdapter(AgentPort):
     def __init__(
         self,
@@ -63,6 +75,15 @@ class AgentsAdapter(AgentPort):
         # configure the OpenAI key for all SDK calls
         openai.api_key = openai_api_key
 
+        self.instructions = instructions
+        # the run is billed to this key and calls tools with these servers' credentials, so only
+        # callers sharing both may share a run; pooled servers are one object per credential set
+        self._run_key = "\x00".join([
+            hashlib.sha256(openai_api_key.encode()).hexdigest(),
+            *(str(id(server)) for server in mcp_servers),
+            instructions,
+        ])
+
         # instantiate the Agent, passing in the MCP servers
         self.agent = Agent(
             name="UnifiedAgent",
@@ -72,9 +93,22 @@ class AgentsAdapter(AgentPort):
         )
 
     async def ask(self, query: str) -> str:
+        # identical questions asked concurrently share a single run
+        return await _inflight_asks.run(
+            f"{self._run_key}\x00{query}",
+            lambda: self._collect(query),
+        )
+
+    async def _collect(self, query: str) -> str:
+        return "".join([chunk async for chunk in self.stream(query)])
+
+    async def stream(self, query: str) -> AsyncIterator[str]:
         # run the agent; it will invoke tools over SSE as needed
-        result = await Runner.run(
+        result = Runner.run_streamed(
             starting_agent=self.agent,
             input=query,
         )
-        return result.final_output
\ No newline at end of file
+        async for event in result.stream_events():
+            # only forward text deltas of model output, not tool calls or lifecycle events
+            if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+                yield event.data.delta
\ No newline at end of file
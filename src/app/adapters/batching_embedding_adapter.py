@@ -0,0 +1,75 @@
+"""
+batching_embedding_adapter.py
+
+This module provides an `EmbeddingPort` decorator that micro-batches concurrent single-text embedding
+requests into one backend call, for use within a microservices-based FastAPI application.
+
+Overview:
+---------
+- `BatchingEmbeddingAdapter` wraps any embedding adapter. Each `embed_query` call is queued on a shared
+  `MicroBatcher`, which forwards the accumulated texts to the inner adapter's `embed_queries` and hands
+  every caller its own vector back.
+- Explicit batches (`embed_queries`) bypass the queue and go straight to the inner adapter.
+
+Key Features:
+-------------
+- **Throughput:** Concurrent requests share one HTTP round-trip instead of paying for one each.
+- **Bounded Latency:** A lone request waits at most `max_latency_ms` before its batch is flushed.
+- **Provider Agnostic:** Works with any `EmbeddingPort` implementation.
+
+Intended Usage:
+---------------
+    embedder = BatchingEmbeddingAdapter(OpenAIEmbeddingAdapter(api_key), max_batch_size=64, max_latency_ms=5)
+    vector = await embedder.embed_query("What is FastAPI?")
+
+The adapter is meant to be long-lived and shared across requests; batching only helps when many
+callers go through the same instance.
+
+Dependencies:
+-------------
+- Project-specific `EmbeddingPort` interface and `MicroBatcher`
+
+"""
+
+from app.batching import MicroBatcher
+from app.ports.embedding_port import EmbeddingPort
+
+class BatchingEmbeddingAdapter(EmbeddingPort):
+    """
+    EmbeddingPort decorator that coalesces concurrent `embed_query` calls.
+
+    Args:
+        inner (EmbeddingPort): The adapter that embeds each batch.
+        max_batch_size (int): Maximum texts per backend call.
+        max_latency_ms (float): Maximum time a text waits for its batch to fill.
+    """
+
+    def __init__(self, inner: EmbeddingPort, max_batch_size: int = 64, max_latency_ms: float = 5.0):
+        self.inner = inner
+        self.batcher = MicroBatcher(inner.embed_queries, max_batch_size, max_latency_ms)
+
+    async def embed_query(self, text: str) -> list[float]:
+        """
+        Embed a single text as part of the next micro-batch.
+
+        Args:
+            text (str): Input text to be embedded.
+
+        Returns:
+            list[float]: The embedding vector for `text`.
+        """
+
+        return await self.batcher.submit(text)
+
+    async def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed an explicit batch directly with the inner adapter.
+
+        Args:
+            texts (list[str]): Input texts to be embedded.
+
+        Returns:
+            list[list[float]]: One embedding vector per input text, in input order.
+        """
+
+        return await self.inner.embed_queries(texts)
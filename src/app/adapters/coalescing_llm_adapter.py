@@ -0,0 +1,63 @@
+"""
+coalescing_llm_adapter.py
+
+This module provides an `LLMPort` decorator that deduplicates identical prompts while they are in flight,
+for use within a microservices-based FastAPI application.
+
+Overview:
+---------
+- `CoalescingLLMAdapter` wraps any LLM adapter. When several requests send the exact same prompt at the same
+  time, only the first one reaches the model; the others await its response through a shared
+  `RequestCoalescer`.
+- It is the exact-match layer of the response-reuse stack: it sits below the semantic cache, which only
+  learns a response once the first call completes.
+
+Key Features:
+-------------
+- **Free Deduplication:** Hot duplicate prompts cost one model call regardless of how many arrive together.
+- **Cancellation Safe:** A caller that disconnects does not cancel the call for the others waiting on it.
+- **Provider Agnostic:** Works with any `LLMPort` implementation.
+
+Intended Usage:
+---------------
+    coalescer = RequestCoalescer()
+    llm = CoalescingLLMAdapter(OpenAILLMAdapter(api_key), coalescer)
+    response = await llm.chat("What is FastAPI?")
+
+The coalescer instance is meant to outlive individual requests; adapters are cheap wrappers around it.
+Use one coalescer per API key: callers sharing a coalescer share calls, and with them the key that is billed.
+
+Dependencies:
+-------------
+- Project-specific `LLMPort` interface and `RequestCoalescer`
+
+"""
+
+from app.batching import RequestCoalescer
+from app.ports.llm_port import LLMPort
+
+class CoalescingLLMAdapter(LLMPort):
+    """
+    LLMPort decorator that shares one model call among identical concurrent prompts.
+
+    Args:
+        inner (LLMPort): The adapter that answers the prompt.
+        coalescer (RequestCoalescer): Shared map of in-flight calls.
+    """
+
+    def __init__(self, inner: LLMPort, coalescer: RequestCoalescer):
+        self.inner = inner
+        self.coalescer = coalescer
+
+    async def chat(self, prompt: str) -> str:
+        """
+        Return the response of the in-flight call for `prompt`, starting one if needed.
+
+        Args:
+            prompt (str): The user input to send to the LLM.
+
+        Returns:
+            str: The model response.
+        """
+
+        return await self.coalescer.run(prompt, lambda: self.inner.chat(prompt))
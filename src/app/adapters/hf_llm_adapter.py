@@ -19,6 +19,12 @@ Core Components:
 - `HfLLMAdapter`: An adapter class that receives text prompts and returns generated 
   text using a specified transformer model. It leverages asyncio for concurrency and 
   isolates synchronous model calls from the async event loop.
+- Concurrent prompts are coalesced by a `MicroBatcher` shared per model, so one
+  padded `model.generate` call serves many requests at once.
+- `_HfModel`: Loads the tokenizer and causal LM once per model name, in bfloat16 on
+  GPU, and keeps the weights resident on the device. Optionally compiles the model
+  with `torch.compile(mode="reduce-overhead")` (`settings.hf_torch_compile`), runs a short
+  warmup generation at load time and generates under `torch.inference_mode()`.
 
 Example:
     adapter = HfLLMAdapter(model_name="gpt2")
@@ -26,6 +32,7 @@ Example:
 
 Dependencies:
 - transformers
+- torch
 - asyncio
 
 Typical Use in a FastAPI Microservice:
@@ -35,17 +42,61 @@ Typical Use in a FastAPI Microservice:
 """
 
 import asyncio
-from transformers import pipeline
+from functools import lru_cache
+import torch
+from transformers import AutoModelForCausalLM, AutoTokenizer
+from app.batching import MicroBatcher
+from app.config import settings
 from app.ports.llm_port import LLMPort
 
+MAX_NEW_TOKENS = 200
+
+class _HfModel:
+    """
+    Tokenizer and causal LM for one model name, loaded once and kept on the device.
+    """
+
+    def __init__(self, model_name: str):
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        dtype = torch.bfloat16 if self.device.type == "cuda" else torch.float32
+
+        # Decoder-only models must be left-padded for batched generation
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, padding_side="left")
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+
+        model = AutoModelForCausalLM.from_pretrained(model_name, torch_dtype=dtype)
+        self.model = model.to(self.device).eval()
+        if settings.hf_torch_compile:
+            self.model = torch.compile(self.model, mode="reduce-overhead")
+
+        # Pay kernel selection, allocator warmup and compilation here, not on the first request
+        self.generate(["warmup"], max_new_tokens=8)
+
+    def generate(self, prompts: list[str], max_new_tokens: int = MAX_NEW_TOKENS) -> list[str]:
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True)
+        inputs = inputs.to(self.device, non_blocking=True)
+        with torch.inference_mode():
+            out = self.model.generate(
+                **inputs,
+                max_new_tokens=max_new_tokens,
+                use_cache=True,
+                pad_token_id=self.tokenizer.pad_token_id,
+            )
+        return self.tokenizer.batch_decode(out, skip_special_tokens=True)
+
+@lru_cache(maxsize=None)
+def _shared_batcher(model_name: str) -> MicroBatcher:
+    model = _HfModel(model_name)
+
+    async def generate(prompts: list[str]) -> list[str]:
+        return await asyncio.to_thread(model.generate, prompts)
+
+    return MicroBatcher(generate, settings.micro_batch_size, settings.micro_batch_latency_ms)
+
 class HfLLMAdapter(LLMPort):
     def __init__(self, model_name: str):
-        self.pipe = pipeline("text-generation", model=model_name)
+        self.batcher = _shared_batcher(model_name)
 
     async def chat(self, prompt: str) -> str:
-        loop = asyncio.get_running_loop()
-        outputs = await loop.run_in_executor(
-            None,
-            lambda: self.pipe(prompt, max_length=200)
-        )
-        return outputs[0]["generated_text"]
+        return await self.batcher.submit(prompt)
@@ -0,0 +1,146 @@
+"""
+onnx_embedding_adapter.py
+
+This module provides a local embedding adapter built on ONNX Runtime with an INT8-quantized sentence
+embedding model, as a drop-in alternative to the OpenAI embedding adapter in a microservices-based
+FastAPI application.
+
+Overview:
+---------
+- `OnnxEmbeddingAdapter` implements `EmbeddingPort` without any network round-trip: texts are tokenized,
+  run through an ONNX Runtime session on CPU, mean-pooled over the attention mask and L2-normalized.
+- On first use the model (MiniLM by default) is exported to ONNX, dynamically quantized to INT8 and
+  saved under `settings.onnx_cache_dir`; later processes load the quantized file directly.
+
+Key Features:
+-------------
+- **Low Latency:** Local inference avoids WAN round-trips, which dominate small embedding requests.
+- **INT8 Weights:** Dynamic quantization shrinks the model and its memory bandwidth requirements.
+- **Batch Friendly:** `embed_queries` embeds a whole list in a single `session.run`; combined with
+  `BatchingEmbeddingAdapter`, concurrent `embed_query` calls coalesce into one run as well.
+- **Shared Model:** The session is loaded once per model id and reused by every adapter instance.
+- **Lazy Imports:** optimum, onnxruntime and transformers are only imported when a model is loaded, so
+  importing this module (as the provider registry always does) costs nothing for other providers.
+
+Intended Usage:
+---------------
+Select it with `EMBEDDING_PROVIDER=onnx`; the OpenAI adapter remains the default.
+
+    adapter = OnnxEmbeddingAdapter()
+    embedding = await adapter.embed_query("How does FastAPI support microservices?")
+
+Dependencies:
+-------------
+- `optimum[onnxruntime]`: ONNX export and ONNX Runtime model wrapper.
+- `transformers`: Tokenizer for the chosen model.
+- `numpy`: Pooling and normalization.
+- `EmbeddingPort`: Abstract interface the adapter implements.
+
+"""
+
+import asyncio
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from app.config import settings
+from app.ports.embedding_port import EmbeddingPort
+
+QUANTIZED_FILE = "model_quantized.onnx"
+
+class _OnnxModel:
+    """
+    Tokenizer and INT8 ONNX Runtime model for one model id.
+    """
+
+    def __init__(self, model_id: str):
+        # imported here, not at module level: the registry imports this module in every process,
+        # including those using the OpenAI provider, which need neither the packages nor their import time
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        model_dir = os.path.join(
+            os.path.expanduser(settings.onnx_cache_dir), model_id.replace("/", "__")
+        )
+        if not os.path.isfile(os.path.join(model_dir, QUANTIZED_FILE)):
+            self._export(model_id, model_dir)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_dir,
+            file_name=QUANTIZED_FILE,
+            provider="CPUExecutionProvider",
+        )
+
+    @staticmethod
+    def _export(model_id: str, model_dir: str) -> None:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+        model.save_pretrained(model_dir)
+        AutoTokenizer.from_pretrained(model_id).save_pretrained(model_dir)
+        quantize_dynamic(
+            os.path.join(model_dir, "model.onnx"),
+            os.path.join(model_dir, QUANTIZED_FILE),
+            weight_type=QuantType.QInt8,
+        )
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        inputs = self.tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+        hidden = self.model(**inputs).last_hidden_state
+
+        # Mean-pool over real tokens, then L2-normalize
+        mask = inputs["attention_mask"][..., None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled / np.clip(norms, 1e-12, None)
+
+@lru_cache(maxsize=None)
+def _shared_model(model_id: str) -> _OnnxModel:
+    return _OnnxModel(model_id)
+
+class OnnxEmbeddingAdapter(EmbeddingPort):
+    """
+    Adapter for embedding queries locally with an INT8-quantized ONNX model.
+    """
+
+    def __init__(self, model_id: str | None = None, api_key: str | None = None):
+        """
+        Initialize the OnnxEmbeddingAdapter.
+
+        Args:
+            model_id (str, optional): HuggingFace model id; defaults to `settings.onnx_embedding_model`.
+            api_key (str, optional): Accepted for parity with remote providers; unused.
+        """
+
+        self.model = _shared_model(model_id or settings.onnx_embedding_model)
+
+    async def embed_query(self, text: str) -> list[float]:
+        """
+        Generate an embedding vector for the given input text.
+
+        Args:
+            text (str): Input text to be embedded.
+
+        Returns:
+            list[float]: The normalized embedding vector.
+        """
+
+        return (await self.embed_queries([text]))[0]
+
+    async def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embedding vectors for many texts in a single ONNX Runtime run.
+
+        Args:
+            texts (list[str]): Input texts to be embedded.
+
+        Returns:
+            list[list[float]]: One normalized embedding vector per input text, in input order.
+        """
+
+        vectors = await asyncio.to_thread(self.model.embed, texts)
+        return vectors.tolist()
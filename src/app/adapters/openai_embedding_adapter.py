@@ -14,6 +14,8 @@ enables seamless substitution or extension with other embedding service provider
 Key Features:
 -------------
 - Asynchronously generates dense vector representations (embeddings) for input text, leveraging OpenAI's API.
+- Embeds many texts at once via `embed_queries`, splitting them into sub-batches of at most
+  `MAX_BATCH_SIZE` inputs that are sent concurrently (bounded by `MAX_CONCURRENT_REQUESTS`).
 - Abstracted behind the `EmbeddingPort` interface to promote testability, maintainability, and loose coupling between core logic and vendor-specific implementations.
 - Uses configuration management to securely retrieve API credentials, supporting twelve-factor and cloud-native deployment best practices.
 - Ideal for microservice deployment scenarios where vector search, semantic search, or text similarity features are required (e.g., search engines, chatbots, recommender systems, and document classifiers).
@@ -28,6 +30,7 @@ Example:
 --------
     adapter = OpenAIEmbeddingAdapter()
     embedding = await adapter.embed_query("How does FastAPI support microservices?")
+    embeddings = await adapter.embed_queries(["first document", "second document"])
 
 Dependencies:
 -------------
@@ -42,10 +45,21 @@ See Also:
 """
 
 
-from openai import OpenAI
+import asyncio
+from operator import attrgetter
+
+from ..clients import get_openai_client
 from ..ports.embedding_port import EmbeddingPort
 from ..config import settings
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Largest number of inputs the embeddings endpoint accepts in one request
+MAX_BATCH_SIZE = 2048
+
+# In-flight sub-batch requests per embed_queries call (tier-1 rate limits)
+MAX_CONCURRENT_REQUESTS = 35
+
 class OpenAIEmbeddingAdapter(EmbeddingPort):
     """
     Adapter for embedding queries using OpenAI's embedding API.
@@ -53,14 +67,18 @@ class OpenAIEmbeddingAdapter(EmbeddingPort):
     Utilizes the OpenAI client to generate embeddings for input texts.
     """
 
-    def __init__(self):
+    def __init__(self, api_key: str | None = None):
         """
         Initialize the OpenAIEmbeddingAdapter.
 
-        Sets up the OpenAI API client using the provided API key from settings.
+        Fetches the shared OpenAI API client for the given API key, falling back
+        to the API key from settings.
+
+        Args:
+            api_key (str, optional): OpenAI API key, e.g. the requesting user's.
         """
 
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = get_openai_client(api_key or getattr(settings, "openai_api_key", None))
 
     async def embed_query(self, text: str) -> list[float]:
         """
@@ -73,5 +91,32 @@ class OpenAIEmbeddingAdapter(EmbeddingPort):
             list[float]: The embedding vector representing the input text.
         """
 
-        resp = await self.client.embeddings.create(model="text-embedding-3-small", input=text)
-        return resp.data[0].embedding
+        return (await self.embed_queries([text]))[0]
+
+    async def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embedding vectors for many texts with as few round-trips as possible.
+
+        Texts are split into sub-batches of at most `MAX_BATCH_SIZE` inputs, which are
+        requested concurrently with at most `MAX_CONCURRENT_REQUESTS` in flight.
+
+        Args:
+            texts (list[str]): Input texts to be embedded.
+
+        Returns:
+            list[list[float]]: One embedding vector per input text, in input order.
+        """
+
+        chunks = [texts[i:i + MAX_BATCH_SIZE] for i in range(0, len(texts), MAX_BATCH_SIZE)]
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def embed_chunk(chunk: list[str]):
+            async with sem:
+                return await self.client.embeddings.create(model=EMBEDDING_MODEL, input=chunk)
+
+        results = await asyncio.gather(*map(embed_chunk, chunks))
+        return [
+            item.embedding
+            for resp in results
+            for item in sorted(resp.data, key=attrgetter("index"))
+        ]
@@ -14,9 +14,10 @@ Usage in a Microservices Context
 -------------------------------
 - This adapter allows your FastAPI-based microservice to interact with OpenAI LLMs as a plug-and-play,
   injectable dependency, enabling easy swapping of underlying LLM providers.
-- It leverages Python's `asyncio` to run the blocking OpenAI API call in a thread pool, ensuring
-  the event loop remains responsive and scalable in concurrent microservice deployments.
-- Designed to be instantiated per-request or as a singleton for API-key-based authenticated access.
+- It uses the native `AsyncOpenAI` client, so concurrent chats cost one coroutine each rather
+  than a thread-pool slot, keeping the event loop responsive in concurrent microservice deployments.
+- Instances are cached per API key by `app.dependencies`; the underlying OpenAI client (and its
+  connection pool) is likewise shared per API key via `app.clients.get_openai_client`.
 
 Typical Use
 -----------
@@ -37,8 +38,7 @@ This module enables robust, scalable LLM integration in service-oriented archite
 following best practices for code decoupling, dependency injection, and asyncio-based concurrency.
 """
 
-import asyncio
-from openai import OpenAI
+from ..clients import get_openai_client
 from ..ports.llm_port import LLMPort
 
 class OpenAILLMAdapter(LLMPort):
@@ -52,14 +52,14 @@ class OpenAILLMAdapter(LLMPort):
 
     def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
         """
-        Initialize the OpenAI client and set the model.
+        Fetch the shared OpenAI client for this key and set the model.
         
         Args:
             api_key (str): OpenAI API key.
             model (str, optional): Model name to use. Defaults to "gpt-4o-mini".
         """
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model  = model
 
     async def chat(self, prompt: str) -> str:
@@ -73,13 +73,8 @@ class OpenAILLMAdapter(LLMPort):
             str: The model's response text.
         """
 
-        loop = asyncio.get_running_loop()
-        # run the blocking .create() in a threadpool
-        resp = await loop.run_in_executor(
-            None,
-            lambda: self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-            )
+        resp = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
         )
         return resp.choices[0].message.content
@@ -9,7 +9,8 @@ The `PostgresUserRepository` class serves as the adapter between the domain-driv
 
 Key Functions:
 --------------
-- **create_user**: Persists a new user with proper password hashing and unique identifier generation. Handles database integrity errors, such as duplicate email registration.
+- **create_user**: Persists a new user with proper password hashing and unique identifier generation. Detects duplicate email registration in the same round-trip via `ON CONFLICT (email) DO NOTHING`, without a failed commit and rollback.
+- **create_users_bulk**: Persists many users with a single multi-row `INSERT ... ON CONFLICT DO NOTHING RETURNING` and one commit, skipping emails that are already registered.
 - **get_user_by_email**: Fetches user entities using an email lookup, enabling authentication and lookup services.
 - **get_by_id**: Retrieves user information by unique user ID for profile or permission checks.
 - **update**: Updates an existing user record in the database, typically used for password resets or profile edits.
@@ -19,7 +20,7 @@ Key Features:
 - **Asynchronous ORM Integration**: Uses SQLAlchemy's async session for non-blocking I/O, ensuring scalability and responsiveness in a microservices environment.
 - **Security Best Practices**: Implements salting and hashing of user passwords before storage.
 - **Open for Extension**: Adheres to the ports-and-adapters (hexagonal) architecture, making it straightforward to provide additional repository implementations (e.g., for testing or alternative databases).
-- **Exception Handling**: Converts DB-specific integrity errors (like duplicate users) into meaningful HTTP responses suitable for FastAPI routes.
+- **Exception Handling**: Converts duplicate users into meaningful HTTP responses suitable for FastAPI routes.
 
 Intended Usage:
 ---------------
@@ -33,8 +34,9 @@ Dependencies:
 
 """
 
+import asyncio
 from sqlalchemy.future import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
 from fastapi import HTTPException, status
 from ..ports.user_repository_port import UserRepositoryPort
 from ..models import User
@@ -47,18 +49,37 @@ class PostgresUserRepository(UserRepositoryPort):
         self.db = db
 
     async def create_user(self, user: UserCreate) -> User:
-        salt = new_salt()
-        user_id = generate_userid(user.email, salt)
-        hashed_pw = hash_password(user.password)
-        db_user = User(id=user_id, email=user.email, salt=salt, hashed_password=hashed_pw, openai_api_key=user.openai_api_key)
-        self.db.add(db_user)
-        try:
-            await self.db.commit()
-        except IntegrityError:
-            await self.db.rollback()
+        # a conflicting email returns no row, so no separate lookup or rollback is needed
+        created = await self.create_users_bulk([user])
+        if not created:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-        await self.db.refresh(db_user)
-        return db_user
+        return created[0]
+
+    async def create_users_bulk(self, users: list[UserCreate]) -> list[User]:
+        if not users:
+            return []
+
+        # bcrypt is CPU-bound but releases the GIL; hash on worker threads, in parallel
+        hashes = await asyncio.gather(
+            *(asyncio.to_thread(hash_password, user.password) for user in users)
+        )
+        rows = []
+        for user, hashed_pw in zip(users, hashes):
+            salt = new_salt()
+            rows.append({
+                "id": generate_userid(user.email, salt),
+                "email": user.email,
+                "salt": salt,
+                "hashed_password": hashed_pw,
+                "openai_api_key": user.openai_api_key,
+            })
+
+        # one round-trip per page of rows (insertmanyvalues) instead of one per user
+        stmt = insert(User).on_conflict_do_nothing(index_elements=["email"]).returning(User)
+        result = await self.db.scalars(stmt, rows)
+        created = list(result.all())
+        await self.db.commit()
+        return created
 
     async def get_user_by_email(self, email: str) -> User | None:
         result = await self.db.execute(select(User).where(User.email == email))
@@ -0,0 +1,165 @@
+"""
+semantic_cache_llm_adapter.py
+
+This module provides an embedding-keyed semantic response cache that sits in front of any `LLMPort`
+adapter in a microservices-based FastAPI application.
+
+Overview:
+---------
+- `SemanticCache` stores (prompt embedding, response) pairs and answers lookups by cosine similarity,
+  so paraphrased or repeated prompts can be served without another LLM round-trip.
+- `SemanticCacheLLMAdapter` implements `LLMPort` by composing an inner LLM adapter with an
+  `EmbeddingPort`: each prompt is embedded, looked up in the cache and only forwarded to the inner
+  adapter on a miss, after which the response is stored.
+
+Key Features:
+-------------
+- **Cosine Similarity Lookup:** Embeddings are L2-normalized on insert into one contiguous float32 matrix of
+  shape `(capacity, dim)`, so a single BLAS matrix-vector product over the filled rows yields every similarity
+  at once, without re-stacking keys on each lookup.
+- **Bounded Memory:** The matrix is preallocated on the first insert; once it is full, the least recently
+  used row is overwritten in place.
+- **Provider Agnostic:** Works with any `LLMPort` and `EmbeddingPort` implementation.
+
+Intended Usage:
+---------------
+    cache = SemanticCache(capacity=1024, threshold=0.87)
+    llm = SemanticCacheLLMAdapter(OpenAILLMAdapter(api_key), OpenAIEmbeddingAdapter(api_key), cache)
+    response = await llm.chat("What is FastAPI?")
+
+The cache instance is meant to outlive individual requests; adapters are cheap wrappers around it.
+Keep one cache per user or API key: a hit returns another prompt's response verbatim, including any
+user-specific context that prompt carried.
+
+Dependencies:
+-------------
+- numpy
+- Project-specific `LLMPort` and `EmbeddingPort` interfaces
+
+"""
+
+import numpy as np
+
+from app.ports.embedding_port import EmbeddingPort
+from app.ports.llm_port import LLMPort
+
+class SemanticCache:
+    """
+    In-memory LRU store of (normalized embedding, response) pairs.
+
+    Embeddings live in a preallocated `(capacity, dim)` float32 matrix (one row per entry) with
+    parallel per-row response and last-used arrays.
+
+    Attributes:
+        capacity (int): Maximum number of entries kept before evicting the least recently used.
+        threshold (float): Minimum cosine similarity for a lookup to count as a hit.
+    """
+
+    def __init__(self, capacity: int, threshold: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity (int): Maximum number of cached entries.
+            threshold (float): Cosine similarity threshold for hits.
+        """
+
+        self.capacity = capacity
+        self.threshold = threshold
+        # allocated on first store, once the embedding dimension is known
+        self._keys: np.ndarray | None = None
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._responses: list[str | None] = [None] * capacity
+        self._size = 0
+        self._clock = 0
+
+    @staticmethod
+    def _normalize(vec: list[float]) -> np.ndarray:
+        arr = np.asarray(vec, dtype=np.float32)
+        norm = np.linalg.norm(arr)
+        return arr / norm if norm else arr
+
+    def _touch(self, row: int) -> None:
+        self._clock += 1
+        self._last_used[row] = self._clock
+
+    def lookup(self, vec: list[float]) -> str | None:
+        """
+        Return the cached response most similar to `vec`, if it clears the threshold.
+
+        Args:
+            vec (list[float]): Embedding of the incoming prompt.
+
+        Returns:
+            str | None: The cached response on a hit, otherwise None.
+        """
+
+        if not self._size:
+            return None
+
+        scores = self._keys[:self._size] @ self._normalize(vec)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        self._touch(best)
+        return self._responses[best]
+
+    def store(self, vec: list[float], response: str) -> None:
+        """
+        Insert a new entry, evicting the least recently used one when full.
+
+        Args:
+            vec (list[float]): Embedding of the prompt.
+            response (str): The LLM response to cache.
+        """
+
+        key = self._normalize(vec)
+        if self._keys is None:
+            self._keys = np.empty((self.capacity, key.shape[0]), dtype=np.float32)
+
+        if self._size < self.capacity:
+            row = self._size
+            self._size += 1
+        else:
+            row = int(np.argmin(self._last_used))
+
+        self._keys[row] = key
+        self._responses[row] = response
+        self._touch(row)
+
+
+class SemanticCacheLLMAdapter(LLMPort):
+    """
+    LLMPort decorator that serves near-duplicate prompts from a `SemanticCache`.
+
+    Args:
+        inner (LLMPort): The adapter that answers cache misses.
+        embedder (EmbeddingPort): Embedding provider used to key the cache.
+        cache (SemanticCache): Shared cache instance.
+    """
+
+    def __init__(self, inner: LLMPort, embedder: EmbeddingPort, cache: SemanticCache):
+        self.inner = inner
+        self.embedder = embedder
+        self.cache = cache
+
+    async def chat(self, prompt: str) -> str:
+        """
+        Return a cached response for similar prompts, otherwise ask the inner adapter.
+
+        Args:
+            prompt (str): The user input to send to the LLM.
+
+        Returns:
+            str: The (possibly cached) model response.
+        """
+
+        vec = await self.embedder.embed_query(prompt)
+        cached = self.cache.lookup(vec)
+        if cached is not None:
+            return cached
+
+        response = await self.inner.chat(prompt)
+        self.cache.store(vec, response)
+        return response
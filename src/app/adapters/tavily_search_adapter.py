@@ -9,9 +9,10 @@ The `TavilySearchAdapter` class abstracts the details of communicating with the
 
 Key Features:
 -------------
-- **Async HTTP Integration:** Utilizes httpx.AsyncClient to perform non-blocking communication for scalable microservices.
+- **Async HTTP Integration:** Utilizes a shared, HTTP/2 httpx.AsyncClient (see `app.clients.get_tavily_client`) to perform non-blocking communication for scalable microservices; concurrent searches multiplex over pooled keep-alive connections.
 - **Configurable Timeouts:** Defines granular connection/read/write/pool timeouts to gracefully handle slow or unreliable network conditions typical in distributed systems.
-- **Robust Error Handling:** Implements automatic retries with exponential backoff for resilient querying of third-party APIs. Propagates persistent errors to allow the microservice to respond appropriately.
+- **Robust Error Handling:** Retries rate limits (429), server errors (5xx) and connection failures with decorrelated-jitter backoff, honoring any `Retry-After` header. Other client errors (4xx) and persistent failures are propagated so the microservice can respond appropriately.
+- **Quiet Under Failure:** Error responses are logged lazily, truncated and sampled (at most one record per status code per second).
 - **Security:** Automatically annotates HTTP requests with the API key in the Authorization header.
 - **Clean Abstraction:** Exposes only a simple `search` interface, hiding all HTTP-specific logic from the rest of the application.
 
@@ -19,7 +20,7 @@ Key Methods:
 ------------
 - **search(query: str, top_k: int = 5) -> List[str]:**
     - Takes a user query and the desired number of top results. Returns a list of result strings from Tavily, or an empty list if none found.
-    - Retries up to 5 times on transient errors, with a capped exponential backoff delay.
+    - Tries up to 5 times on transient errors, sleeping for `Retry-After` when the server sends it and for a jittered, capped delay otherwise.
 
 Intended Usage:
 ---------------
@@ -28,50 +29,103 @@ Intended to be injected into FastAPI routes, service layers, or background worke
 Dependencies:
 -------------
 - httpx (for async HTTP)
-- asyncio (for concurrency, backoff)
+- orjson (for fast JSON encoding and decoding)
+- asyncio, random (for concurrency, jittered backoff)
 - Project-specific search port interface
 
 """
 
 import asyncio
+import logging
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from typing import List
-from httpx import AsyncClient, HTTPError, Timeout
+import orjson
+from httpx import ConnectError, HTTPStatusError, TimeoutException
 
+from app.clients import get_tavily_client
 from app.ports.tavily_search_port import TavilySearchPort
 
+class _SampleFilter(logging.Filter):
+    # Let at most one record per (message, status) through each `interval` seconds,
+    # so error storms don't turn into log storms
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self.interval = interval
+        self.last_ts: dict[tuple, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.msg, record.args[0] if record.args else None)
+        last = self.last_ts.get(key)
+        if last is not None and record.created - last < self.interval:
+            return False
+        self.last_ts[key] = record.created
+        return True
+
+logger = logging.getLogger(__name__)
+logger.addFilter(_SampleFilter())
+
+# Longest slice of an error body that gets logged
+MAX_LOGGED_BODY = 512
+
+BACKOFF_BASE = 0.1
+BACKOFF_CAP = 8.0
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, (ConnectError, TimeoutException, asyncio.TimeoutError))
+
+def _retry_after(exc: Exception) -> float | None:
+    # Retry-After is either delta-seconds or an HTTP date
+    if not isinstance(exc, HTTPStatusError):
+        return None
+    value = exc.response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
 class TavilySearchAdapter(TavilySearchPort):
     def __init__(self, base_url: str, api_key: str):
-        timeout = Timeout(
-            connect=10.0,  
-            read=60.0,     
-            write=30.0,    
-            pool=5.0       
-        )
-        self.client = AsyncClient(
-            base_url=base_url.rstrip("/"),
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout=timeout,
-        )
+        self.client = get_tavily_client(base_url)
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
 
     async def search(self, query: str, top_k: int = 5) -> List[str]:
         max_tries = 5
+        delay = BACKOFF_BASE
         for attempt in range(max_tries):
             try:
                 resp = await self.client.post(
                     "/search",
-                    json={"query": query, "max_results": top_k},
+                    content=orjson.dumps({"query": query, "max_results": top_k}),
+                    headers=self.headers,
                 )
                 if resp.status_code != 200:
-                    body = resp.text()
-                    print(f"Tavily  error {resp.status_code}: {body}")
+                    logger.warning("Tavily error %d: %s", resp.status_code, resp.text[:MAX_LOGGED_BODY])
                 resp.raise_for_status()
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 # return the `results` list, or empty if missing
                 return data.get("results", [])
-            except (HTTPError, asyncio.TimeoutError):
-                # if last attempt, re-raise so caller sees the error
-                if attempt == max_tries - 1:
+            except (HTTPStatusError, ConnectError, TimeoutException, asyncio.TimeoutError) as exc:
+                # re-raise client errors and the last attempt so caller sees the error
+                if not _is_retryable(exc) or attempt == max_tries - 1:
                     raise
-                # otherwise back off and retry
-                backoff = min(2 ** attempt, 8)
-                await asyncio.sleep(backoff)
+                # otherwise honor Retry-After, or back off with decorrelated jitter
+                wait = _retry_after(exc)
+                if wait is None:
+                    delay = random.uniform(BACKOFF_BASE, min(BACKOFF_CAP, delay * 3))
+                    wait = delay
+                await asyncio.sleep(wait)
@@ -5,14 +5,14 @@ This module provides a dependency-injection mechanism for accessing the user dat
 
 Overview:
 ---------
-Defines the `get_user_db` async dependency that yields an instance of `SQLAlchemyUserDatabase` configured for your custom `User` ORM model. This allows application routes and service layers to perform database operations (CRUD, authentication, etc.) against user records using an async interface, as required in modern, microservices-based FastAPI projects.
+Re-exports the `get_user_db` async dependency from `app.db.user`, which returns an instance of `SQLAlchemyUserDatabase` configured for your custom `User` ORM model. This allows application routes and service layers to perform database operations (CRUD, authentication, etc.) against user records using an async interface, as required in modern, microservices-based FastAPI projects.
 
 Key Features:
 -------------
 - **Async SQLAlchemy Integration:** Ensures non-blocking database operations with `AsyncSession`, critical for high-concurrency in microservices deployments.
 - **FastAPI Dependency Injection:** Designed as a dependency (`Depends`) to be consumed by API routes and background services, ensuring clean separation and reusability.
 - **Compliance with FastAPI-Users:** Integrates with the `fastapi-users` plugin, supporting advanced authentication, registration, and user management with minimal boilerplate.
-- **UUID-based Primary Keys:** Explicitly configures user IDs as UUIDs, aiding in distributed system uniqueness and interoperability.
+- **Single Definition:** `app.db.user.get_user_db` is the canonical dependency; importing it from here yields the same callable, so FastAPI's per-request dependency cache treats both import paths as one dependency.
 
 Intended Usage:
 ---------------
@@ -27,21 +27,6 @@ Dependencies:
 
 """
 
-from uuid import UUID
-from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi_users.db import SQLAlchemyUserDatabase
-from app.models import User
-from app.db.core import get_async_session
+from app.db.user import get_user_db
 
-async def get_user_db(session: AsyncSession = Depends(get_async_session)):
-    """
-    Yield a SQLAlchemyUserDatabase instance for user data access with async support.
-
-    Args:
-        session (AsyncSession): The asynchronous SQLAlchemy session dependency.
-
-    Yields:
-        SQLAlchemyUserDatabase: An async user database instance configured for the User model.
-    """
-    
-    yield SQLAlchemyUserDatabase(User, session, id_model=UUID)
+__all__ = ["get_user_db"]
@@ -11,15 +11,25 @@ Key Features:
 -------------
 - **Superuser-Only Access:** All routes require the requester to be both active and a designated superuser, minimizing risk in sensitive operations.
 - **Async SQLAlchemy Support:** All database interactions use async sessions, promoting scalability and high-throughput required in cloud-native microservices.
+- **Lean Listing Queries:** List endpoints select only the columns `UserRead` serializes, in a single Core query, and return the plain row mappings; no ORM instances are built for read-only listings.
+- **Single-Pass Serialization:** Handlers hand rows to FastAPI untouched, so each row is validated once against `response_model` and written straight to JSON bytes by Pydantic's Rust core; the NDJSON export encodes rows with orjson, which handles UUIDs natively.
 - **Separation of Concerns:** The admin router isolates critical operations (activation, verification, auditing) from general user API routes for clearer code ownership and enhanced security.
 - **Extensible Admin API:** Easily expanded for other admin actions (e.g., user bans, role changes) in large-scale applications.
 
 Key Endpoints:
 --------------
-- **GET /admin/pending**: Lists users who have not yet been activated.
+- **GET /admin/pending**: Lists users who have not yet been activated, one keyset-paginated page at a time.
 - **POST /admin/approve/{user_id}**: Activates a user, setting `is_active` to `True`.
+- **POST /admin/approve**: Activates every user in a JSON list of ids with a single `UPDATE ... RETURNING`.
 - **POST /admin/verify/{user_id}**: Verifies a user, setting `is_verified` to `True`.
-- **GET /admin/users**: Lists all users in the system.
+- **POST /admin/verify**: Verifies every user in a JSON list of ids with a single `UPDATE ... RETURNING`.
+- **GET /admin/users**: Lists all users in the system, one keyset-paginated page at a time.
+
+- **GET /admin/users.ndjson**: Streams every user as newline-delimited JSON, for exports too large for one response.
+- **GET /admin/db-pool**: Reports the database connection pool's size, checked-out and overflow connections.
+
+Both list endpoints take `limit` and `after` (the `next_cursor` of the previous page) and return
+`{items, next_cursor}`; each page is an index range scan on `id`, so its cost does not grow with the table.
 
 Design Considerations:
 ---------------------
@@ -37,57 +47,156 @@ Dependencies:
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.router import fastapi_users
-from app.db.core import get_async_session
-from app.db.user import get_user_db
+from app.auth.deps import current_superuser
+from app.db.core import AsyncSessionLocal, engine, get_async_session
 from app.models import User as UserTable
-from app.schemas import UserRead
+from app.schemas import UserPage, UserRead
+
+# columns serialized by UserRead; list queries select just these, as plain rows
+READ_COLUMNS = (
+    UserTable.id,
+    UserTable.email,
+    UserTable.is_active,
+    UserTable.is_superuser,
+    UserTable.is_verified,
+    UserTable.openai_api_key,
+    UserTable.tavily_api_key,
+    UserTable.firecrawl_api_key,
+)
+# listings build no ORM instances, so nothing can lazy-load; a field added to UserRead must be
+# selected here too, or it would silently serialize as its default
+# (an explicit raise, not an assert, so the check survives `python -O`)
+if {column.key for column in READ_COLUMNS} != set(UserRead.model_fields):
+    raise RuntimeError("READ_COLUMNS is out of sync with UserRead")
 
-# only superusers may hit any of these routes
-current_superuser = fastapi_users.current_user(active=True, superuser=True)
+# rows fetched per round-trip by the NDJSON export
+EXPORT_BATCH_SIZE = 1000
 
 router = APIRouter(
     prefix="/admin",
     tags=["admin"],
+    # only superusers may hit any of these routes
     dependencies=[Depends(current_superuser)],
 )
 
 
-@router.get("/pending", response_model=List[UserRead])
+# Statements below are lambda_stmt()s: SQLAlchemy keys its compiled-SQL cache on the lambda's
+# code object, so a request neither rebuilds nor re-hashes the construct; closure variables
+# (limit, cursor, ids) are extracted as bound parameters.
+
+def _page_stmt(limit: int, after: UUID | None, pending: bool):
+    # keyset pagination: seek past the cursor instead of counting skipped rows
+    stmt = lambda_stmt(lambda: select(*READ_COLUMNS).order_by(UserTable.id).limit(limit))
+    if pending:
+        stmt += lambda s: s.where(UserTable.is_active == False)
+    if after is not None:
+        stmt += lambda s: s.where(UserTable.id > after)
+    return stmt
+
+
+def _activate_stmt(ids: list[UUID]):
+    return lambda_stmt(
+        lambda: update(UserTable).where(UserTable.id.in_(ids)).values(is_active=True).returning(*READ_COLUMNS)
+    )
+
+
+def _activate_one_stmt(user_id: UUID):
+    return lambda_stmt(
+        lambda: update(UserTable).where(UserTable.id == user_id).values(is_active=True).returning(*READ_COLUMNS)
+    )
+
+
+def _verify_stmt(ids: list[UUID]):
+    return lambda_stmt(
+        lambda: update(UserTable).where(UserTable.id.in_(ids)).values(is_verified=True).returning(*READ_COLUMNS)
+    )
+
+
+def _verify_one_stmt(user_id: UUID):
+    return lambda_stmt(
+        lambda: update(UserTable).where(UserTable.id == user_id).values(is_verified=True).returning(*READ_COLUMNS)
+    )
+
+
+EXPORT_STMT = lambda_stmt(lambda: select(*READ_COLUMNS).order_by(UserTable.id))
+
+
+# Handlers return plain dicts rather than UserRead instances: FastAPI validates the return value
+# against response_model anyway, so building the models here would validate every row twice.
+
+async def _user_page(session: AsyncSession, limit: int, after: UUID | None, pending: bool = False) -> dict:
+    rows = (await session.execute(_page_stmt(limit, after, pending))).mappings().all()
+    next_cursor = rows[-1]["id"] if len(rows) == limit else None
+    return {"items": [dict(row) for row in rows], "next_cursor": next_cursor}
+
+
+@router.get("/pending", response_model=UserPage)
 async def list_pending_users(
+    limit: int = Query(100, ge=1, le=1000),
+    after: UUID | None = None,
     session: AsyncSession = Depends(get_async_session),
 ):
     """
-    Retrieve a list of users who have not yet been activated.
+    Retrieve a page of users who have not yet been activated.
 
     Args:
+        limit (int): Maximum number of users to return. Defaults to 100.
+        after (UUID, optional): Cursor from the previous page; only users with a greater id are returned.
         session (AsyncSession): The asynchronous SQLAlchemy session.
 
     Returns:
-        List[UserRead]: A list of user records for users pending activation.
+        UserPage: Pending users ordered by id, plus the cursor of the next page.
     """
 
-    result = await session.execute(
-        select(UserTable).where(UserTable.is_active == False)
-    )
-    return result.scalars().all()
+    return await _user_page(session, limit, after, pending=True)
+
+
+async def _set_flags(session: AsyncSession, stmt) -> list[dict]:
+    # a single UPDATE ... RETURNING replaces the get-then-update round-trips
+    result = await session.execute(stmt, execution_options={"synchronize_session": False})
+    rows = result.mappings().all()
+    await session.commit()
+    return [dict(row) for row in rows]
+
+
+@router.post("/approve", response_model=List[UserRead])
+async def approve_users(
+    ids: List[UUID],
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Approve and activate several users at once by setting their 'is_active' field to True.
+
+    Args:
+        ids (List[UUID]): The unique identifiers of the users to activate.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        List[UserRead]: The updated user records; unknown ids are skipped.
+    """
+
+    if not ids:
+        return []
+    return await _set_flags(session, _activate_stmt(ids))
 
 
 @router.post("/approve/{user_id}", response_model=UserRead)
 async def approve_user(
     user_id: UUID,
-    user_db = Depends(get_user_db),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """
     Approve and activate a user by setting their 'is_active' field to True.
 
     Args:
         user_id (UUID): The unique identifier of the user to activate.
-        user_db: The user database dependency.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
 
     Returns:
         UserRead: The updated user record with activation status.
@@ -96,23 +205,44 @@ async def approve_user(
         HTTPException: If the user with the specified ID is not found.
     """
 
-    user = await user_db.get(user_id)
-    if not user:
+    users = await _set_flags(session, _activate_one_stmt(user_id))
+    if not users:
         raise HTTPException(status_code=404, detail="User not found")
-    return await user_db.update(user, {"is_active": True})
+    return users[0]
+
+
+@router.post("/verify", response_model=List[UserRead])
+async def verify_users(
+    ids: List[UUID],
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Verify several users at once by setting their 'is_verified' field to True.
+
+    Args:
+        ids (List[UUID]): The unique identifiers of the users to verify.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        List[UserRead]: The updated user records; unknown ids are skipped.
+    """
+
+    if not ids:
+        return []
+    return await _set_flags(session, _verify_stmt(ids))
 
 
 @router.post("/verify/{user_id}", response_model=UserRead)
 async def verify_user(
     user_id: UUID,
-    user_db = Depends(get_user_db),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """
     Verify a user by setting their 'is_verified' field to True.
 
     Args:
         user_id (UUID): The unique identifier of the user to verify.
-        user_db: Dependency for user database access.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
 
     Returns:
         UserRead: The updated user record with verification status.
@@ -121,29 +251,85 @@ async def verify_user(
         HTTPException: If the user with the specified ID is not found.
     """
 
-    user = await user_db.get(user_id)
-    if not user:
+    users = await _set_flags(session, _verify_one_stmt(user_id))
+    if not users:
         raise HTTPException(status_code=404, detail="User not found")
-    return await user_db.update(user, {"is_verified": True})
+    return users[0]
 
 @router.get(
     "/users",
-    response_model=List[UserRead],
+    response_model=UserPage,
     summary="List all users (superuser only)",
 )
 async def list_all_users(
+    limit: int = Query(100, ge=1, le=1000),
+    after: UUID | None = None,
     session: AsyncSession = Depends(get_async_session),
 ):
     """
-    Retrieve a list of all users.
+    Retrieve a page of all users.
 
     Args:
+        limit (int): Maximum number of users to return. Defaults to 100.
+        after (UUID, optional): Cursor from the previous page; only users with a greater id are returned.
         session (AsyncSession): The asynchronous SQLAlchemy session.
 
     Returns:
-        List[UserRead]: A list of all user records.
+        UserPage: Users ordered by id, plus the cursor of the next page.
+    """
+
+    return await _user_page(session, limit, after)
+
+
+@router.get(
+    "/users.ndjson",
+    summary="Export all users as NDJSON (superuser only)",
+)
+async def export_all_users():
+    """
+    Stream every user as newline-delimited JSON.
+
+    Rows are fetched from a server-side cursor `EXPORT_BATCH_SIZE` at a time and written
+    out as they arrive, so memory stays constant however many users there are.
+
+    Returns:
+        StreamingResponse: An `application/x-ndjson` body with one `UserRead` object per line.
+    """
+
+    async def rows():
+        # own session: it has to stay open for as long as the body is being streamed
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(
+                EXPORT_STMT,
+                execution_options={"yield_per": EXPORT_BATCH_SIZE},
+            )
+            async for partition in result.mappings().partitions():
+                # rows hold exactly the UserRead columns; orjson encodes UUIDs natively
+                yield b"".join(orjson.dumps(dict(row)) + b"\n" for row in partition)
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/db-pool",
+    summary="Database connection pool status (superuser only)",
+)
+async def db_pool_status():
+    """
+    Report how the database connection pool is being used.
+
+    A `checked_out` count pinned at `size + overflow` means requests are waiting on pool checkout.
+
+    Returns:
+        dict: The pool's configured size, idle and checked-out connections, current overflow,
+              and SQLAlchemy's one-line status summary.
     """
-    
-    result = await session.execute(select(UserTable))
-    return result.scalars().all()
 
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
@@ -0,0 +1,29 @@
+"""
+deps.py
+
+This module defines the shared fastapi-users guard dependencies for a microservices-based FastAPI application.
+
+Overview:
+---------
+`fastapi_users.current_user(...)` returns a new dependency callable on every call. FastAPI caches a
+dependency's result per request by callable, so routers that each build their own guard decode the JWT
+and load the user once per guard. Every router, provider, and app-level include imports its guard from
+here instead, so a request authenticates exactly once and FastAPI reuses the same `Dependant` graph.
+
+Key Features:
+-------------
+- **current_active_user:** Any active user.
+- **current_verified_user:** An active user with a verified email; guards the RAG, search, and agent APIs.
+- **current_superuser:** An active superuser; guards the admin API.
+
+Dependencies:
+-------------
+- fastapi-users (via the `fastapi_users` instance in `app.auth.router`)
+
+"""
+
+from app.auth.router import fastapi_users
+
+current_active_user = fastapi_users.current_user(active=True)
+current_verified_user = fastapi_users.current_user(active=True, verified=True)
+current_superuser = fastapi_users.current_user(active=True, superuser=True)
@@ -9,9 +9,10 @@ The `UserManager` class extends `fastapi_users`' base user manager functionality
 
 Key Features:
 -------------
-- **Password Policy Enforcement:** Ensures all newly registered users set a password meeting a minimum length requirement, raising clear exceptions for violations.
+- **Password Policy Enforcement:** Ensures all newly registered users set a non-blank password between 8 characters and bcrypt's 72-byte input limit, raising clear exceptions for violations.
+- **Non-Blocking Login:** Password verification on login runs in a worker thread with the shared, fixed-cost `password_helper`, so a burst of logins does not stall the event loop.
 - **Secure Token Management:** Manages secrets for user password reset and verification workflows, using application-level secure settings.
-- **Lifecycle Hooks:** Automatically sets new users as inactive on registration, supporting workflows where admin approval is mandatory before activation. Post-registration logic is handled using the `on_after_register` async hook.
+- **Lifecycle Hooks:** New users are inserted inactive on registration, supporting workflows where admin approval is mandatory before activation. Post-registration logic is handled using the `on_after_register` async hook.
 - **FastAPI Dependency Injection:** Exposes `get_user_manager` as a dependency for seamless integration into FastAPI routes or background jobs.
 - **Extensible and Modular:** By inheriting from FastAPI Users' manager and UUID mixin, this class enables robust, scalable, and extensible user management for distributed, microservices-oriented systems.
 
@@ -31,20 +32,28 @@ Dependencies:
 
 """
 
+import asyncio
+import logging
 import uuid
 from typing import Optional
 
 from fastapi import Depends, Request
-from fastapi_users import BaseUserManager, UUIDIDMixin, InvalidPasswordException
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import BaseUserManager, UUIDIDMixin, InvalidPasswordException, exceptions
 from fastapi_users.db import SQLAlchemyUserDatabase
 
 from app.db.user import get_user_db
 from app.models import User
 from app.schemas import UserCreate
 from app.config import settings
+from app.security import password_helper
 
 SECRET = settings.secret_key
 ACCESS_TOKEN_EXPIRE = settings.access_token_expire_minutes * 60
+MIN_PASSWORD_LENGTH = 8
+MAX_PASSWORD_BYTES = 72
+
+logger = logging.getLogger(__name__)
 
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     reset_password_token_secret = SECRET
@@ -61,21 +70,113 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         """
         Validate the given password for the user during registration.
 
-        Ensures the password meets minimum length requirements.
+        Ensures the password meets length requirements and is not blank. The
+        fastapi-users base implementation is a no-op, so it is not awaited.
 
         Args:
             password (str): The password to validate.
             user (UserCreate): The user registration data.
 
         Raises:
-            InvalidPasswordException: If the password is shorter than 8 characters.
+            InvalidPasswordException: If the password is shorter than 8 characters,
+                longer than bcrypt's 72-byte input limit, or only whitespace.
         """
-        
-        if len(password) < 8:
+
+        if len(password) < MIN_PASSWORD_LENGTH:
             raise InvalidPasswordException(
                 reason="Password must be at least 8 characters"
             )
-        await super().validate_password(password, user)
+        # bcrypt only reads the first 72 bytes, and refuses longer inputs outright
+        if len(password.encode()) > MAX_PASSWORD_BYTES:
+            raise InvalidPasswordException(
+                reason="Password must be at most 72 bytes"
+            )
+        if not password.strip():
+            raise InvalidPasswordException(
+                reason="Password cannot be only whitespace"
+            )
+
+    async def create(
+        self,
+        user_create: UserCreate,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> User:
+        """
+        Create a user awaiting admin approval.
+
+        Same flow as the fastapi-users implementation, except that the user is inserted
+        with `is_active=False` in the first place (no follow-up UPDATE) and the password
+        is hashed in a worker thread.
+
+        Args:
+            user_create (UserCreate): The registration data.
+            safe (bool): If True, privileged fields such as is_superuser are ignored. Defaults to False.
+            request (Optional[Request]): The HTTP request context (optional).
+
+        Returns:
+            User: The newly created, inactive user.
+
+        Raises:
+            UserAlreadyExists: If a user with the same email already exists.
+        """
+
+        await self.validate_password(user_create.password, user_create)
+
+        existing_user = await self.user_db.get_by_email(user_create.email)
+        if existing_user is not None:
+            raise exceptions.UserAlreadyExists()
+
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        password = user_dict.pop("password")
+        user_dict["hashed_password"] = await asyncio.to_thread(self.password_helper.hash, password)
+        # new accounts wait for an admin to approve them
+        user_dict["is_active"] = False
+
+        created_user = await self.user_db.create(user_dict)
+
+        await self.on_after_register(created_user, request)
+
+        return created_user
+
+    async def authenticate(
+        self, credentials: OAuth2PasswordRequestForm
+    ) -> Optional[User]:
+        """
+        Authenticate a user by email and password without blocking the event loop.
+
+        Same behaviour as the fastapi-users implementation, including the hash upgrade
+        and the dummy hash for unknown emails, but bcrypt runs in a worker thread.
+
+        Args:
+            credentials (OAuth2PasswordRequestForm): The submitted email and password.
+
+        Returns:
+            Optional[User]: The authenticated user, or None if the credentials are invalid.
+        """
+
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # hash anyway, so unknown emails take as long as wrong passwords
+            await asyncio.to_thread(self.password_helper.hash, credentials.password)
+            return None
+
+        verified, updated_password_hash = await asyncio.to_thread(
+            self.password_helper.verify_and_update,
+            credentials.password,
+            user.hashed_password,
+        )
+        if not verified:
+            return None
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {"hashed_password": updated_password_hash})
+
+        return user
 
     async def on_after_register(
         self, user: User, request: Optional[Request] = None
@@ -83,15 +184,14 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         """
         Perform actions after a new user registers.
 
-        Sets the new user to inactive and logs the event.
+        Logs the event; the user was already created inactive by `create`.
 
         Args:
             user (User): The newly registered user.
             request (Optional[Request]): The HTTP request context (optional).
         """
-        
-        await self.user_db.update(user, {"is_active": False})
-        print(f"New user registered: {user.id}")
+
+        logger.info("user_registered", extra={"user_id": str(user.id)})
 
 async def get_user_manager(
     user_db: SQLAlchemyUserDatabase = Depends(get_user_db),
@@ -106,4 +206,4 @@ async def get_user_manager(
         UserManager: An instance of UserManager configured with the provided user database.
     """
 
-    yield UserManager(user_db)
+    yield UserManager(user_db, password_helper)
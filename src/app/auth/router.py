@@ -14,6 +14,7 @@ Key Features:
 - **Central Router Composition:** Aggregates all authentication and user management endpoints under a single APIRouter instance, simplifying inclusion into the application's API gateway or service orchestrator.
 - **Type-Safe and Modern:** Utilizes type-safe generics and Pydantic schemas, ensuring integration consistency across microservices and facilitating API documentation.
 - **Convenient Dependency Injection:** Relies on application settings and user manager dependency injection for flexible configuration, security, and testability.
+- **Shared User Guards:** The `fastapi_users` instance built here backs the single guard dependencies in `app.auth.deps`, which every router uses, so each request authenticates and loads its user exactly once.
 
 Usage/Integration:
 ------------------
@@ -32,6 +33,8 @@ Dependencies:
 """
 
 import uuid
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends
 from fastapi_users import FastAPIUsers
 from fastapi_users.authentication import (
@@ -40,7 +43,7 @@ from fastapi_users.authentication import (
     JWTStrategy,
 )
 
-from app.auth.manager import get_user_manager
+from app.auth.manager import ACCESS_TOKEN_EXPIRE, get_user_manager
 from app.schemas import UserRead, UserCreate, UserUpdate
 from app.config import settings
 
@@ -49,19 +52,28 @@ router = APIRouter()
 # Transport + strategy factory
 bearer_transport = BearerTransport(tokenUrl="/auth/jwt/login")
 
-def get_jwt_strategy() -> JWTStrategy:
+@lru_cache(maxsize=1)
+def _strategy() -> JWTStrategy:
+    return JWTStrategy(
+        secret=settings.secret_key,
+        lifetime_seconds=ACCESS_TOKEN_EXPIRE,
+    )
+
+async def get_jwt_strategy() -> JWTStrategy:
     """
-    Create and return a JWTStrategy instance configured with application settings.
+    Return the JWTStrategy configured with application settings.
+
+    The strategy is stateless, so one instance is built on first use and shared by
+    every authenticated request. fastapi-users resolves this as a dependency on every
+    authenticated route, so it is `async def`: FastAPI would run a plain `def` through
+    its threadpool.
 
     Returns:
-        JWTStrategy: An instance of JWTStrategy using the application's secret key
+        JWTStrategy: The JWTStrategy using the application's secret key
         and token lifetime.
     """
-    
-    return JWTStrategy(
-        secret=settings.secret_key,
-        lifetime_seconds=settings.access_token_expire_minutes * 60,
-    )
+
+    return _strategy()
 
 # Build the JWT backend
 auth_backend = AuthenticationBackend(
@@ -0,0 +1,202 @@
+"""
+batching.py
+
+This module provides a dynamic micro-batcher that coalesces concurrent single-item calls into batched
+backend calls for the adapters of a microservices-based FastAPI application.
+
+Overview:
+---------
+- Embedding APIs and local model pipelines amortize their fixed per-call cost across a batch, while
+  request handlers naturally ask for one item at a time.
+- `MicroBatcher` queues each submitted item together with a future, and a background task drains the
+  queue into batches that are sent to the backend in a single call. Each caller's future is then resolved
+  with its own result.
+- `RequestCoalescer` deduplicates identical in-flight calls: the first caller for a key starts the backend
+  call and later callers with the same key await that same call instead of issuing their own.
+
+Key Features:
+-------------
+- **Bounded Latency:** A batch is flushed once it holds `max_batch_size` items or `max_latency_ms` has
+  passed since its first item arrived, whichever comes first.
+- **Error Propagation:** If the backend call fails, or returns a different number of results than it was
+  given inputs, every caller in that batch receives an exception; no caller is left waiting.
+- **Lazy Start:** The worker task is created on first use, inside the running event loop.
+- **Clean Shutdown:** `aclose_batchers()` stops every live batcher's worker and fails its pending callers;
+  the application lifespan calls it on shutdown.
+
+Intended Usage:
+---------------
+    batcher = MicroBatcher(adapter.embed_queries, max_batch_size=64, max_latency_ms=5)
+    vector = await batcher.submit("How does FastAPI support microservices?")
+
+    coalescer = RequestCoalescer()
+    answer = await coalescer.run(prompt, lambda: llm.chat(prompt))
+
+Dependencies:
+-------------
+- asyncio, hashlib, weakref (Python standard library)
+
+"""
+
+import asyncio
+import hashlib
+import weakref
+from typing import Any, Awaitable, Callable
+
+# every batcher that may own a worker task, so shutdown can stop them all
+_live_batchers: "weakref.WeakSet[MicroBatcher]" = weakref.WeakSet()
+
+class MicroBatcher:
+    """
+    Coalesces concurrent `submit` calls into batched calls of `fn`.
+
+    Attributes:
+        fn (Callable[[list], Awaitable[list]]): Batch function returning one result per input, in order.
+        max_batch_size (int): Largest number of items sent to `fn` at once.
+        max_latency_ms (float): Longest time the first item of a batch waits for company.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[list], Awaitable[list]],
+        max_batch_size: int = 64,
+        max_latency_ms: float = 5.0,
+    ):
+        """
+        Initialize the batcher without starting its worker.
+
+        Args:
+            fn (Callable[[list], Awaitable[list]]): The batch function to call.
+            max_batch_size (int): Maximum items per batch. Defaults to 64.
+            max_latency_ms (float): Maximum wait before flushing a partial batch. Defaults to 5.0.
+        """
+
+        self.fn = fn
+        self.max_batch_size = max_batch_size
+        self.max_latency_ms = max_latency_ms
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        _live_batchers.add(self)
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue `item` for the next batch and wait for its result.
+
+        Args:
+            item (Any): A single input for the batch function.
+
+        Returns:
+            Any: The batch function's result for `item`.
+        """
+
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """
+        Stop the worker task and fail every caller still waiting for a result.
+
+        A later `submit` starts a fresh worker.
+        """
+
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+        queued = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        _fail(queued, RuntimeError("MicroBatcher closed"))
+
+    async def _collect(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        batch.append(await self._queue.get())
+        deadline = asyncio.get_running_loop().time() + self.max_latency_ms / 1000
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self) -> None:
+        batch: list[tuple[Any, asyncio.Future]] = []
+        try:
+            while True:
+                batch = []
+                await self._collect(batch)
+                # Skip callers that were cancelled while waiting
+                batch = [(item, fut) for item, fut in batch if not fut.done()]
+                if not batch:
+                    continue
+                try:
+                    results = await self.fn([item for item, _ in batch])
+                except Exception as e:
+                    _fail(batch, e)
+                    continue
+                # zip() would silently drop the callers past the end of a short result list
+                if len(results) != len(batch):
+                    _fail(batch, RuntimeError(
+                        f"Batch function returned {len(results)} results for {len(batch)} inputs"
+                    ))
+                    continue
+                for (_, fut), result in zip(batch, results):
+                    if not fut.done():
+                        fut.set_result(result)
+        except asyncio.CancelledError:
+            # shutting down: the batch being collected or computed must not wait forever
+            _fail(batch, RuntimeError("MicroBatcher closed"))
+            raise
+
+def _fail(batch: list[tuple[Any, asyncio.Future]], error: BaseException) -> None:
+    for _, fut in batch:
+        if not fut.done():
+            fut.set_exception(error)
+
+async def aclose_batchers() -> None:
+    """
+    Close every live `MicroBatcher`, e.g. from the application lifespan on shutdown.
+    """
+
+    await asyncio.gather(*(batcher.aclose() for batcher in list(_live_batchers)))
+
+class RequestCoalescer:
+    """
+    Shares one in-flight call among concurrent callers asking for the same key.
+    """
+
+    def __init__(self):
+        self._inflight: dict[bytes, asyncio.Task] = {}
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await the in-flight call for `key`, starting `fn()` if there is none.
+
+        The call runs as its own task, so a caller that is cancelled does not cancel
+        it for the others still waiting on it.
+
+        Args:
+            key (str): Identity of the request, e.g. the prompt.
+            fn (Callable[[], Awaitable[Any]]): Starts the backend call on a miss.
+
+        Returns:
+            Any: The shared result of the call.
+        """
+
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        task = self._inflight.get(digest)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[digest] = task
+            task.add_done_callback(lambda _: self._inflight.pop(digest, None))
+        return await asyncio.shield(task)
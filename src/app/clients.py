@@ -0,0 +1,71 @@
+"""
+clients.py
+
+This module provides process-wide, cached SDK clients for external providers used by the adapters
+of a microservices-based FastAPI application.
+
+Overview:
+---------
+- Building a new SDK client for every adapter would throw away its HTTP connection pool (and TLS
+  sessions) each time.
+- `get_openai_client` memoizes one client per API key, so every adapter for the same key shares a
+  single keep-alive connection pool across requests. It is sized to match the per-key adapter cache
+  in `app.dependencies`, so a cached adapter's client is never evicted from under it.
+- `get_tavily_client` memoizes one HTTP/2 `httpx.AsyncClient` per Tavily base URL; per-user credentials
+  are sent as request headers, so every user multiplexes over the same connections.
+
+Intended Usage:
+---------------
+    from app.clients import get_openai_client
+
+    client = get_openai_client(api_key)
+    tavily = get_tavily_client(settings.tavily_base_url)
+
+Dependencies:
+-------------
+- openai>=1.0
+- httpx[http2]
+- Python standard library: functools
+
+"""
+
+from functools import lru_cache
+
+from httpx import AsyncClient, Limits, Timeout
+from openai import AsyncOpenAI
+
+@lru_cache(maxsize=1024)
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    Return the shared async OpenAI client for `api_key`, creating it on first use.
+
+    Args:
+        api_key (str): OpenAI API key.
+
+    Returns:
+        AsyncOpenAI: A client whose connection pool is reused across requests.
+    """
+
+    return AsyncOpenAI(api_key=api_key)
+
+@lru_cache(maxsize=8)
+def get_tavily_client(base_url: str) -> AsyncClient:
+    """
+    Return the shared HTTP/2 client for the Tavily API at `base_url`, creating it on first use.
+
+    The pool is sized for concurrent searches and keeps idle connections alive, so the hot
+    path never pays a TCP/TLS handshake; HTTP/2 multiplexes concurrent searches over them.
+
+    Args:
+        base_url (str): Base URL of the Tavily API.
+
+    Returns:
+        AsyncClient: A client without credentials; callers send their own Authorization header.
+    """
+
+    return AsyncClient(
+        base_url=base_url.rstrip("/"),
+        http2=True,
+        limits=Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+        timeout=Timeout(connect=10.0, read=60.0, write=30.0, pool=5.0),
+    )
@@ -24,12 +24,15 @@ Key Features:
 
 Intended Usage:
 ---------------
-- Import and inject the `settings` object into microservice routers, service layers, adapters, and authentication backends to access consistent, centralized configuration.
+- Import the `settings` object into microservice routers, service layers, adapters, and authentication backends to access consistent, centralized configuration.
+- Settings are read at import time (e.g. provider classes and the database engine are built from them), so overrides
+  must be in the environment before the application is imported; `app.dependency_overrides[get_settings]` has no effect.
 - Extend this class as new features, providers, or endpoints are added to the microservices ecosystem.
 
 Dependencies:
 -------------
 - pydantic-settings (for environment management and type validation)
+- SQLAlchemy URL parsing (for the derived async database URL)
 - Python standard library: datetime (for time-based config)
 
 Security & Best Practices:
@@ -39,7 +42,11 @@ Security & Best Practices:
 
 """
 
-from pydantic_settings import BaseSettings
+from functools import cached_property, lru_cache
+
+from pydantic import computed_field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
 from datetime import timedelta
 
 class Settings(BaseSettings):
@@ -59,6 +66,32 @@ class Settings(BaseSettings):
         user_repository (str): The user repository type. Defaults to "postgres".
         mcp_base_url (str): Base URL for MCP API. Defaults to "https://api.macdonml.com".
         tool_providers (list[str]): List of enabled tool providers. Defaults to ["calculator"].
+        semantic_cache_enabled (bool): Serve near-duplicate LLM prompts from the semantic cache. Defaults to False.
+        semantic_cache_threshold (float): Cosine similarity needed for a semantic cache hit. Defaults to 0.87.
+        semantic_cache_size (int): Maximum number of semantic cache entries per API key. Defaults to 1024.
+        semantic_cache_max_keys (int): API keys whose semantic caches are kept; the least recently used key's cache is dropped beyond it. Defaults to 32.
+            Each cache holds a `semantic_cache_size x embedding dim` float32 matrix, so the memory ceiling is
+            `semantic_cache_max_keys * semantic_cache_size * dim * 4` bytes: about 200 MB with the defaults and
+            1536-dimensional OpenAI embeddings (about 6 MB per key).
+        micro_batch_size (int): Maximum items coalesced into one embedding or HF generation call. Defaults to 64.
+        micro_batch_latency_ms (float): Longest a request waits for its micro-batch to fill. Defaults to 5.0.
+        hf_model_name (str): HuggingFace model served by the "hf" LLM provider. Defaults to "gpt2".
+        hf_torch_compile (bool): Compile the HuggingFace model with torch.compile. Defaults to False.
+        onnx_embedding_model (str): Model exported for the "onnx" embedding provider. Defaults to "sentence-transformers/all-MiniLM-L6-v2".
+        onnx_cache_dir (str): Where exported, INT8-quantized ONNX models are kept. Defaults to "~/.cache/llm_app_template/onnx".
+        mcp_pool_size (int): Maximum number of MCP tool server connections kept open. Defaults to 256.
+        mcp_health_interval (float): Seconds between health pings of pooled MCP servers. Defaults to 30.0.
+        mcp_evict_grace (float): Seconds an MCP server evicted from the pool stays open for agent runs still using it. Defaults to 300.0.
+        db_pool_size (int): Database connections kept open in the engine's pool. Defaults to 20.
+        db_max_overflow (int): Extra connections opened beyond `db_pool_size` under bursts. Defaults to 10.
+        db_pool_timeout (float): Seconds to wait for a free connection before failing. Defaults to 5.0.
+        db_pool_recycle (int): Seconds after which a pooled connection is replaced. Defaults to 1800.
+        cors_origins (list[str]): Origins allowed to call the API from a browser; with an explicit list, credentialed requests are allowed too. Defaults to ["*"].
+        bcrypt_rounds (int): bcrypt cost factor for new password hashes. Defaults to 10.
+        sql_echo (bool): Log every SQL statement and its parameters (debugging only). Defaults to False.
+        db_query_cache_size (int): Compiled SQL statements kept in the engine's cache. Defaults to 1200.
+        db_statement_cache_size (int): Prepared statements cached per connection by asyncpg; set 0 behind pgbouncer in transaction mode. Defaults to 1024.
+        async_database_url (str): `database_url` with its PostgreSQL driver set to asyncpg (computed).
     """
 
     database_url: str
@@ -79,7 +112,60 @@ class Settings(BaseSettings):
     mcp_base_url: str = "https://api.macdonml.com"
     tool_providers: list[str] = ["calculator", "firecrawl"]
 
-    class Config:
-        env_file = ".env"
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.87
+    semantic_cache_size: int = 1024
+    semantic_cache_max_keys: int = 32
+
+    micro_batch_size: int = 64
+    micro_batch_latency_ms: float = 5.0
+
+    hf_model_name: str = "gpt2"
+    hf_torch_compile: bool = False
+
+    onnx_embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    onnx_cache_dir: str = "~/.cache/llm_app_template/onnx"
+
+    mcp_pool_size: int = 256
+    mcp_health_interval: float = 30.0
+    mcp_evict_grace: float = 300.0
+
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 5.0
+    db_pool_recycle: int = 1800
+    sql_echo: bool = False
+    db_query_cache_size: int = 1200
+    db_statement_cache_size: int = 1024
+
+    cors_origins: list[str] = ["*"]
+
+    bcrypt_rounds: int = 10
+
+    @computed_field
+    @cached_property
+    def async_database_url(self) -> str:
+        # parse rather than str.replace: handles postgres://, +psycopg2 and already-async URLs alike
+        url = make_url(self.database_url)
+        if url.get_backend_name() in ("postgresql", "postgres"):
+            url = url.set(drivername="postgresql+asyncpg")
+        return url.render_as_string(hide_password=False)
+
+    # read-only after startup; request code only ever reads settings
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, loading them from the environment on first use.
+
+    No route depends on this function; modules read the `settings` instance it creates at
+    import time, so configuration changes must be made through the environment.
+
+    Returns:
+        Settings: The shared, frozen settings instance.
+    """
+
+    return Settings()
 
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,11 @@
+"""
+Database package for the application.
+
+`app.db.core` is the single source of truth for the async engine and session factory; the names are
+re-exported here so `from app.db import engine` and `from app.db.core import engine` yield the same
+objects and only one connection pool is ever created.
+"""
+
+from app.db.core import AsyncSessionLocal, engine, get_async_session, get_db
+
+__all__ = ["AsyncSessionLocal", "engine", "get_async_session", "get_db"]
@@ -10,10 +10,10 @@ Overview:
 ---------
 - Initializes the SQLAlchemy async engine with connection parameters sourced
   from application settings, converting a standard PostgreSQL DSN to asyncpg format.
-- Provides async sessionmaker factory (`AsyncSessionLocal`) for efficient session creation,
+- Provides an `async_sessionmaker` factory (`AsyncSessionLocal`) for efficient session creation,
   crucial for high-concurrency microservices.
-- Exposes `get_db` and `get_async_session` dependency providers, yielding AsyncSession
-  objects for use in FastAPI endpoints, background tasks, and service layers.
+- Exposes the `get_async_session` dependency provider (also available as its alias `get_db`),
+  yielding AsyncSession objects for use in FastAPI endpoints, background tasks, and service layers.
 
 Key Features:
 -------------
@@ -23,6 +23,15 @@ Key Features:
   using context managers (session close/cleanup on exit).
 - **Configuration-Driven:** Reads connection parameters from application-level config,
   promoting portability across environments and deployments.
+- **Compiled SQL Cache:** The engine's compiled-statement cache holds `db_query_cache_size` entries
+  (SQLAlchemy's default is 500). Raw `text()` statements should be module-level constants, as
+  `SELECT_ONE` is, so repeated calls reuse one cache key.
+- **Sized Connection Pool:** The engine keeps `db_pool_size` connections open (plus up to
+  `db_max_overflow` under bursts), pings them before use and recycles them periodically, so
+  requests reuse warm connections instead of opening new ones; checkouts give up after
+  `db_pool_timeout` seconds rather than queueing indefinitely. Connections cache prepared
+  statements and use TCP keepalives, so dropped connections are detected early. `warm_pool` fills the pool at
+  startup, so the first requests do not pay the connection handshake.
 - **Dependency Injection Ready:** Designed for seamless integration into FastAPI's
   dependency injection system—any route, service, or worker can simply `Depends(get_async_session)`.
 
@@ -47,24 +56,58 @@ microservices-based designs.
 
 """
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
 
-DATABASE_URL = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
-engine = create_async_engine(DATABASE_URL, echo=True)
-AsyncSessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+DATABASE_URL = settings.async_database_url
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=settings.sql_echo,
+    echo_pool=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    # compiled-SQL cache; keep text() queries as module-level constants so they hit it too
+    query_cache_size=settings.db_query_cache_size,
+    connect_args={
+        # asyncpg's own statement cache, and SQLAlchemy's cache of prepared statements on top of it
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": min(settings.db_statement_cache_size, 256),
+        "server_settings": {
+            # let the server notice connections silently dropped by NAT / load balancers
+            "tcp_keepalives_idle": "30",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "3",
+            # JIT compilation only slows down short OLTP queries like ours
+            "jit": "off",
+        },
+    },
+)
+# no autoflush: every write path commits explicitly, so reads never need an implicit flush
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+SELECT_ONE = text("SELECT 1")
 
-async def get_db() -> AsyncSession:
+async def warm_pool() -> None:
     """
-    Provide a database session using an asynchronous context manager.
+    Open `db_pool_size` connections up front so early requests skip the connect handshake.
 
-    Yields:
-        AsyncSession: An active SQLAlchemy asynchronous session.
+    Every connection runs a `SELECT 1` while all of them are held at once, which forces the
+    pool to open distinct connections; they are then returned to the pool, ready for reuse.
     """
 
-    async with AsyncSessionLocal() as session:
-        yield session
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(SELECT_ONE)
+
+    await asyncio.gather(*(ping() for _ in range(settings.db_pool_size)))
 
 async def get_async_session() -> AsyncSession:
     """
@@ -76,3 +119,7 @@ async def get_async_session() -> AsyncSession:
     
     async with AsyncSessionLocal() as session:
         yield session
+
+# One callable for both names: FastAPI caches dependencies per callable, so a request that
+# reaches the session through either name shares a single session (and pool connection).
+get_db = get_async_session
@@ -8,7 +8,7 @@ registration, and user profile features through FastAPI’s dependency system.
 
 Overview:
 ---------
-- Defines the `get_user_db` function as a FastAPI dependency, yielding a `SQLAlchemyUserDatabase`
+- Defines the `get_user_db` function as a FastAPI dependency, returning a `SQLAlchemyUserDatabase`
   instance. This integrates with the fastapi-users framework and supports non-blocking,
   async database access using SQLAlchemy’s async ORM.
 - Centralizes user database access, streamlining how other microservices or application
@@ -25,6 +25,8 @@ Key Features:
   and services, encouraging a clean, testable, and maintainable architecture.
 - **Dependency Injection Ready:** Designed for FastAPI’s dependency system, providing
   type-safe, reusable user DB access for authentication, registration, and user management APIs.
+- **One Wrapper per Session:** The `SQLAlchemyUserDatabase` is memoized in `session.info`, so a
+  request that reaches its session through several dependency chains builds it only once.
 
 Usage:
 ------
@@ -51,16 +53,23 @@ from app.models import User
 
 async def get_user_db(
     session: AsyncSession = Depends(get_async_session),
-):
+) -> SQLAlchemyUserDatabase:
     """
-    Yield a SQLAlchemyUserDatabase instance for user operations.
+    Return a SQLAlchemyUserDatabase instance for user operations.
+
+    A plain return rather than a generator: there is nothing to clean up here (the session's
+    lifecycle belongs to `get_async_session`), so FastAPI needs no exit-stack entry for it.
 
     Args:
         session (AsyncSession): The asynchronous database session dependency.
 
-    Yields:
+    Returns:
         SQLAlchemyUserDatabase: User database instance configured with the provided session and User model.
     """
 
-    # session first, model second
-    yield SQLAlchemyUserDatabase(session, User)
+    # one wrapper per session: every dependency path that reaches this session reuses it
+    user_db = session.info.get("user_db")
+    if user_db is None:
+        # session first, model second
+        user_db = session.info["user_db"] = SQLAlchemyUserDatabase(session, User)
+    return user_db
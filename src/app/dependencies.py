@@ -14,10 +14,12 @@ Overview:
 Key Features:
 -------------
 - **Pluggable Adapters:** Selects service and API adapters at runtime based on application config and user context, enabling flexible upgrades, support for multiple providers, and easy A/B testing.
+- **Reused Adapters:** LLM and Tavily adapter stacks are memoized per API key in a bounded LRU keyed on the key's blake2b digest, so repeat requests skip rebuilding them and the cache holds no plaintext keys.
 - **User-context Security:** Injects secrets (like API keys) from authenticated/verified users only, enforcing access control and proper authorization boundaries in distributed systems.
-- **Session & Resource Lifecycles:** Properly manages database sessions and tool connections, ensuring resources are initialized and closed under error-checked, async-safe conditions.
+- **Session & Resource Lifecycles:** Properly manages database sessions and tool connections, ensuring resources are initialized and closed under error-checked, async-safe conditions. MCP tool servers are reused from a shared, health-checked pool instead of being reconnected per request.
 - **Prompt Engine Integration:** Central management of prompt templates via Jinja2 for RAG, agent, and summarization pipelines.
-- **Exception Handling:** Raises appropriate HTTP errors for missing credentials, unknown providers, or connection failures—ensuring clear communication to API clients and aiding in secure microservice orchestration.
+- **No Threadpool Hops:** Providers that do no blocking work are `async def`, so FastAPI calls them inline on the event loop instead of offloading each one to its threadpool.
+- **Exception Handling:** Refuses to start with an unknown LLM, embedding, or repository provider (each adapter class is resolved once at import), and raises appropriate HTTP errors for missing credentials, unknown tool providers, or connection failures—ensuring clear communication to API clients and aiding in secure microservice orchestration.
 
 Intended Usage:
 ---------------
@@ -34,14 +36,18 @@ Dependencies:
 Security & Best Practices:
 --------------------------
 - All AI/retrieval/service classes are instantiated with the correct credentials for the requesting user, strongly limiting horizontal privilege escalation.
-- Error handling and logging (with traceback) are built-in for visibility into dependency instantiation failures.
+- Error handling and logging (with traceback, via the standard `logging` module) are built-in for visibility into dependency instantiation failures.
 
 """
 
 
-import os
-import traceback
-from typing import List
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Final, List
 
 from fastapi import Depends, HTTPException, status
 from jinja2 import Environment, FileSystemLoader
@@ -50,8 +56,14 @@ from app.config                         import settings
 from app.db.core                        import get_db
 from app.models                         import User
 from app.adapters.tavily_search_adapter import TavilySearchAdapter
+from app.ports.embedding_port           import EmbeddingPort
 from app.ports.llm_port                 import LLMPort
 from app.ports.user_repository_port     import UserRepositoryPort
+from app.adapters.semantic_cache_llm_adapter import SemanticCache, SemanticCacheLLMAdapter
+from app.adapters.batching_embedding_adapter import BatchingEmbeddingAdapter
+from app.adapters.coalescing_llm_adapter import CoalescingLLMAdapter
+from app.batching                       import RequestCoalescer
+from app.mcp_pool                       import MCPServerPool
 from app.registry                       import (
     LLM_PROVIDERS,
     EMBEDDING_PROVIDERS,
@@ -60,9 +72,77 @@ from app.registry                       import (
 )
 
 # FASTAPI-USERS DEPENDENCIES
-from app.auth.router import fastapi_users
 # “active+verified” ensures is_active=True AND is_verified=True
-current_verified = fastapi_users.current_user(active=True, verified=True)
+from app.auth.deps import current_verified_user
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_provider(registry: dict, key: str, kind: str):
+    # provider choice is fixed for the process: resolve it once, and refuse to start on a typo
+    try:
+        return registry[key]
+    except KeyError:
+        raise RuntimeError(f"Unknown {kind} provider '{key}'") from None
+
+def _lru_by_key_digest(maxsize: int):
+    """
+    Memoize a one-argument builder that takes an API key, keyed on the key's blake2b digest.
+
+    Works like `functools.lru_cache(maxsize)`, except that the cache's keys are 16-byte digests
+    rather than the plaintext secrets, and the key itself is only passed through to the builder.
+
+    Args:
+        maxsize (int): Number of keys kept; the least recently used one is dropped beyond it.
+
+    Returns:
+        Callable: A decorator for `build(api_key)`.
+    """
+
+    def decorator(build):
+        cache: OrderedDict[bytes, object] = OrderedDict()
+
+        @wraps(build)
+        def cached(api_key: str):
+            digest = hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+            if digest in cache:
+                cache.move_to_end(digest)
+                return cache[digest]
+            value = cache[digest] = build(api_key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return value
+
+        cached.cache_clear = cache.clear
+        return cached
+
+    return decorator
+
+_LLM_CLS = _resolve_provider(LLM_PROVIDERS, settings.llm_provider, "LLM")
+_EMB_CLS = _resolve_provider(EMBEDDING_PROVIDERS, settings.embedding_provider, "embedding")
+_REPO_CLS = _resolve_provider(USER_REPOSITORY_PROVIDERS, settings.user_repository, "user repository")
+_TOOL_KEYS = tuple(settings.tool_providers)
+for _key in _TOOL_KEYS:
+    _resolve_provider(TOOL_PROVIDERS, _key, "tool")
+
+# Prompt templates ship next to this module
+PROMPTS_DIR: Final[str] = str(Path(__file__).resolve().parent / "prompts")
+
+# Process-wide prompt template environment; templates are compiled once and cached, and never
+# re-checked on disk (they ship with the code)
+prompt_env = Environment(
+    loader=FileSystemLoader(PROMPTS_DIR),
+    autoescape=False,
+    cache_size=400,
+    auto_reload=False,
+)
+
+# Process-wide pool of connected MCP tool servers, warmed and closed by the app lifespan
+mcp_pool = MCPServerPool(
+    max_size=settings.mcp_pool_size,
+    health_interval=settings.mcp_health_interval,
+    evict_grace=settings.mcp_evict_grace,
+)
 
 
 from app.services.user_service            import UserService
@@ -73,8 +153,8 @@ from app.adapters.agents_adapter          import AgentsAdapter
 from app.services.agent_service           import AgentService
 
 
-def get_llm_provider(
-    current_user: User = Depends(current_verified),
+async def get_llm_provider(
+    current_user: User = Depends(current_verified_user),
 ) -> LLMPort:
     """
     Retrieve the appropriate LLM provider adapter based on settings and user credentials.
@@ -86,17 +166,9 @@ def get_llm_provider(
         LLMPort: An instance of the selected LLM provider adapter.
 
     Raises:
-        HTTPException: If the provider is unknown or no API key is available.
+        HTTPException: If no API key is available.
     """
 
-    provider_key = settings.llm_provider
-    AdapterCls  = LLM_PROVIDERS.get(provider_key)
-    if not AdapterCls:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unknown LLM provider '{provider_key}'"
-        )
-
     api_key = current_user.openai_api_key
     if not api_key:
         raise HTTPException(
@@ -104,12 +176,37 @@ def get_llm_provider(
             detail="No API key available for LLM."
         )
 
-    if provider_key == "hf":
-        return AdapterCls(settings.hf_model_name)
-    return AdapterCls(api_key=api_key)
+    llm = _build_llm(api_key)
+    if settings.semantic_cache_enabled:
+        # the wrapper is per request and cheap; the cache it reads comes from a small LRU, so an
+        # idle key's cache matrix is freed once it is evicted
+        llm = SemanticCacheLLMAdapter(llm, get_batching_embedder(api_key), _semantic_cache(api_key))
+    return llm
+
+
+@_lru_by_key_digest(maxsize=settings.semantic_cache_max_keys)
+def _semantic_cache(api_key: str) -> SemanticCache:
+    # one cache per key: cached responses can carry a user's RAG/search context, so they must
+    # never answer another user's prompt (the matrix is only allocated on first insert)
+    return SemanticCache(
+        capacity=settings.semantic_cache_size,
+        threshold=settings.semantic_cache_threshold,
+    )
+
+
+@_lru_by_key_digest(maxsize=1024)
+def _build_llm(api_key: str) -> LLMPort:
+    # adapters are stateless wrappers, so one stack per key serves every request
+    if settings.llm_provider == "hf":
+        adapter = _LLM_CLS(settings.hf_model_name)
+    else:
+        adapter = _LLM_CLS(api_key=api_key)
 
+    # one coalescer per key: a shared call is billed to, and fails with, a single key
+    return CoalescingLLMAdapter(adapter, RequestCoalescer())
 
-def get_llm_service(
+
+async def get_llm_service(
     llm_provider: LLMPort = Depends(get_llm_provider),
 ) -> LLMService:
     """
@@ -125,7 +222,30 @@ def get_llm_service(
     return LLMService(llm_provider)
 
 
-def get_embedding_provider():
+@lru_cache(maxsize=8)
+def get_batching_embedder(api_key: str | None = None) -> EmbeddingPort:
+    """
+    Return the process-wide micro-batching embedder for `api_key`.
+
+    Sharing one instance per key lets concurrent requests coalesce into a single
+    embedding call.
+
+    Args:
+        api_key (str, optional): API key for the embedding provider; None uses the configured default.
+
+    Returns:
+        EmbeddingPort: A `BatchingEmbeddingAdapter` around the configured provider.
+    """
+
+    inner = _EMB_CLS(api_key=api_key) if api_key else _EMB_CLS()
+    return BatchingEmbeddingAdapter(
+        inner,
+        max_batch_size=settings.micro_batch_size,
+        max_latency_ms=settings.micro_batch_latency_ms,
+    )
+
+
+async def get_embedding_provider():
     """
     Retrieve an instance of the configured embedding provider adapter.
 
@@ -133,8 +253,7 @@ def get_embedding_provider():
         An instance of the selected embedding provider adapter.
     """
 
-    AdapterCls = EMBEDDING_PROVIDERS[settings.embedding_provider]
-    return AdapterCls()
+    return get_batching_embedder()
 
 
 async def get_user_repository(db=Depends(get_db)) -> UserRepositoryPort:
@@ -148,11 +267,10 @@ async def get_user_repository(db=Depends(get_db)) -> UserRepositoryPort:
         UserRepositoryPort: An instance of the selected user repository.
     """
 
-    RepoCls = USER_REPOSITORY_PROVIDERS[settings.user_repository]
-    return RepoCls(db)
+    return _REPO_CLS(db)
 
 
-def get_user_service(
+async def get_user_service(
     repo=Depends(get_user_repository),
 ) -> UserService:
     """
@@ -168,24 +286,50 @@ def get_user_service(
     return UserService(repo)
 
 
-def get_prompt_env() -> Environment:
+def warm_prompt_env() -> None:
+    """
+    Compile every prompt template into the shared Environment's cache and pre-render
+    the agent instructions.
+
+    Called from the application lifespan, so the first request that renders a prompt
+    does not pay for the filesystem lookup and template compilation.
     """
-    Create and return a Jinja2 Environment for loading prompt templates.
+
+    for name in prompt_env.list_templates():
+        prompt_env.get_template(name)
+    _render_agent_instructions(_TOOL_KEYS)
+
+
+async def warm_local_models() -> None:
+    """
+    Load the locally run models of the configured providers before the first request.
+
+    Exporting and loading the ONNX embedder, or loading the HuggingFace LLM and its warmup
+    generation, takes seconds; done lazily, the first burst of requests would all wait on it.
+    Loading runs on a worker thread, and the results land in the same caches requests use.
+    Remote (OpenAI) providers have nothing to load and are skipped.
+    """
+
+    if settings.embedding_provider == "onnx":
+        await asyncio.to_thread(get_batching_embedder)
+    if settings.llm_provider == "hf":
+        await asyncio.to_thread(_LLM_CLS, settings.hf_model_name)
+
+
+async def get_prompt_env() -> Environment:
+    """
+    Return the shared Jinja2 Environment for loading prompt templates.
 
     Returns:
         Environment: A Jinja2 Environment configured to load templates
                      from the 'prompts' directory without autoescaping.
     """
 
-    templates_dir = os.path.join(os.path.dirname(__file__), "prompts")
-    return Environment(
-        loader=FileSystemLoader(templates_dir),
-        autoescape=False,
-    )
+    return prompt_env
 
 
-def get_tavily_adapter(
-    current_user: User = Depends(current_verified),
+async def get_tavily_adapter(
+    current_user: User = Depends(current_verified_user),
 ) -> TavilySearchAdapter:
     """
     Retrieve a Tavily search adapter using the current user's API key.
@@ -206,13 +350,18 @@ def get_tavily_adapter(
             detail="No Tavily API key set for this user."
         )
 
+    return _build_tavily(current_user.tavily_api_key)
+
+
+@_lru_by_key_digest(maxsize=1024)
+def _build_tavily(api_key: str) -> TavilySearchAdapter:
     return TavilySearchAdapter(
         base_url=settings.tavily_base_url,
-        api_key=current_user.tavily_api_key,
+        api_key=api_key,
     )
 
 
-def get_tavily_summary_service(
+async def get_tavily_summary_service(
     llm: LLMService  = Depends(get_llm_service),
     env: Environment = Depends(get_prompt_env),
 ) -> TavilySummaryService:
@@ -230,23 +379,48 @@ def get_tavily_summary_service(
     return TavilySummaryService(llm, env)
 
 
+@lru_cache(maxsize=1)
+def _render_agent_instructions(tool_providers: tuple[str, ...]) -> str:
+    # settings.tool_providers is fixed for the process, so this renders once, at startup
+    template = prompt_env.get_template("agent_instructions.jinja2")
+    return template.render(tool_providers=list(tool_providers))
+
+
+async def _checkout_tools(current_user: User) -> list:
+    # pooled, already-connected MCP servers; any misses connect concurrently
+    results = await asyncio.gather(
+        *(mcp_pool.get_provider(key, settings, current_user) for key in _TOOL_KEYS),
+        return_exceptions=True,
+    )
+    failures = []
+    for key, result in zip(_TOOL_KEYS, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to connect to tool %s", key, exc_info=result)
+            failures.append(f"'{key}': {result}")
+    # every provider was attempted concurrently, so report all the ones that failed at once;
+    # servers that did connect stay in the shared pool for other requests
+    if failures:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Could not connect to tool {', '.join(failures)}"
+        )
+    return list(results)
+
+
 async def get_agent_adapter(
-    current_user: User = Depends(current_verified),
-    env: Environment  = Depends(get_prompt_env),
+    current_user: User = Depends(current_verified_user),
 ) -> AgentPort:
     """
     Asynchronously construct and return an agent adapter configured with user credentials and available tools.
 
     Args:
         current_user (User): The currently authenticated and verified user.
-        env (Environment): The Jinja2 environment for loading prompt templates.
 
     Returns:
         AgentPort: An initialized agent adapter with configured MCP servers and instructions.
 
     Raises:
-        HTTPException: If no OpenAI API key is available, a tool provider is unknown, 
-                       or connection to a tool provider fails.
+        HTTPException: If no OpenAI API key is available or connection to a tool provider fails.
     """
 
     api_key = current_user.openai_api_key
@@ -256,32 +430,10 @@ async def get_agent_adapter(
             detail="No OpenAI API key available for agent."
         )
 
-    # build your MCP servers…
-    mcp_servers = []
-    for key in settings.tool_providers:
-        factory = TOOL_PROVIDERS.get(key)
-        if not factory:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unknown tool provider '{key}'"
-            )
-        mcp = factory(settings, current_user)
-        if hasattr(mcp, "connect"):
-            try:
-                await mcp.connect()
-            except Exception as e:
-                tb = traceback.format_exc()
-                print(f"Failed to connect to tool '{key}':\n{tb}")
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=f"Could not connect to tool '{key}': {e}"
-                )
-        mcp_servers.append(mcp)
-
-    template = env.get_template("agent_instructions.jinja2")
-    instructions = template.render(
-        tool_providers=settings.tool_providers,
-    )
+    # with no tool providers configured there is nothing to check out of the pool
+    mcp_servers = await _checkout_tools(current_user) if _TOOL_KEYS else []
+
+    instructions = _render_agent_instructions(_TOOL_KEYS)
 
     return AgentsAdapter(
         openai_api_key=current_user.openai_api_key,
@@ -290,7 +442,7 @@ async def get_agent_adapter(
     )
 
 
-def get_agent_service(
+async def get_agent_service(
     adapter: AgentPort = Depends(get_agent_adapter)
 ) -> AgentService:
     """
@@ -0,0 +1,63 @@
+"""
+log_config.py
+
+This module configures non-blocking logging for a microservices-based FastAPI application.
+
+Overview:
+---------
+- Handlers such as `StreamHandler` write synchronously; when stdout/stderr is a pipe to a slow log
+  collector, a full pipe buffer stalls the thread that logged, which inside a request handler is
+  the event loop.
+- `start_queue_logging` routes every root-logger record through a `QueueHandler`, which only puts the
+  record on an in-memory queue, and starts a `QueueListener` that formats and writes records on a
+  background thread.
+
+Intended Usage:
+---------------
+    listener = start_queue_logging()
+    ...
+    listener.stop()  # flushes queued records
+
+The application lifespan starts the listener on startup and stops it on shutdown. Modules keep
+logging through `logging.getLogger(__name__)` with lazy `%`-style arguments.
+
+Dependencies:
+-------------
+- Python standard library: logging, logging.handlers, queue
+
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+def start_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Move the root logger's output onto a background thread.
+
+    Existing root handlers (or a stderr `StreamHandler` if there are none) are handed to a
+    `QueueListener`; the root logger itself is left with a single `QueueHandler`.
+
+    Args:
+        level (int): Root logger level. Defaults to `logging.INFO`.
+
+    Returns:
+        QueueListener: The started listener; call `stop()` on shutdown to flush it.
+    """
+
+    root = logging.getLogger()
+    handlers = root.handlers[:] or [logging.StreamHandler()]
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.removeHandler(handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -13,7 +13,7 @@ Overview:
 - Registers routers for:
   * Authentication (JWT, registration, password reset, etc.)
   * Admin-only user management and audit endpoints
-  * User self-management endpoints (guarded for superusers)
+  * User self-management endpoints (`/users`, mounted once by the auth router)
   * Retrieval-augmented generation (RAG) pipelines
   * Tavily-powered contextual search
   * Agent-based AI completion/inference
@@ -23,8 +23,21 @@ Key Features:
 -------------
 - **Modular Router Integration:** All domain logic is encapsulated in sub-routers, supporting microservice scalability and separation of concerns.
 - **Fine-grained Dependency Injection:** Critical endpoints are protected by user role/verification checks, minimizing risk of privilege escalation or unauthorized access.
-- **Plug-and-Play CORS:** Enables easy adaption to API gateway or frontend deployments with flexible CORS headers.
+- **Plug-and-Play CORS:** Allowed origins come from `settings.cors_origins`, so API gateway or frontend deployments only change configuration.
 - **Health Endpoint:** Provides a root `GET /` endpoint for basic liveness checks and orchestration tooling.
+- **Warm Tool Connections:** The application lifespan connects shared MCP tool servers on startup and closes every
+  pooled MCP session on shutdown; the database connection pool is likewise filled on startup and disposed on shutdown.
+- **Non-Blocking Logging:** The lifespan moves log output onto a background `QueueListener` thread, so a slow
+  log collector cannot stall the event loop.
+- **Password Hashing Pool:** The lifespan installs a thread pool sized for login bursts as the event loop's default
+  executor, so bcrypt work never queues behind the small stock pool.
+- **Precompiled Prompts:** The lifespan compiles every prompt template into the shared Jinja2 Environment.
+- **Preloaded Local Models:** Local ONNX embedding and HuggingFace LLM models are loaded during startup, so a
+  burst of first requests does not queue behind a model load.
+- **uvloop Event Loop:** The container and compose entrypoints run uvicorn with `--loop uvloop --http httptools`
+  (both shipped by `uvicorn[standard]`), so asyncpg, httpx, and MCP I/O run on libuv. The loop is chosen on the
+  command line because uvicorn creates it before this module is imported; calling `uvloop.install()` here would
+  be too late to take effect.
 
 Intended Usage:
 ---------------
@@ -43,28 +56,51 @@ Security & Best Practices:
 
 """
 
-from fastapi import FastAPI, Depends
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.batching import aclose_batchers
+from app.config import settings
+from app.db.core import engine, warm_pool
+from app.dependencies import mcp_pool, warm_local_models, warm_prompt_env
+from app.log_config import start_queue_logging
+from app.security import password_executor
 from app.auth.admin import router as admin_router
-from app.auth.router import router as auth_router, fastapi_users
-from app.schemas import UserRead, UserUpdate
+from app.auth.router import router as auth_router
 from app.routers.rag import router as rag_router
 from app.routers.agent import router as agent_router
 from app.routers.tavily import router as tavily_router
 
-# Dependencies to protect endpoints
-current_active = fastapi_users.current_user(active=True)
-current_verified = fastapi_users.current_user(active=True, verified=True)
-current_superuser = fastapi_users.current_user(active=True, superuser=True)
-
-app = FastAPI(title="Your App with Auth + RAG")
-
-# CORS configuration
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener = start_queue_logging()
+    # asyncio.to_thread (password hashing, local models) runs on the sized pool
+    asyncio.get_running_loop().set_default_executor(password_executor)
+    # open DB and shared MCP tool connections up front, close them all on shutdown
+    await warm_pool()
+    await mcp_pool.startup(settings)
+    # compile prompt templates and load local models now rather than on the first request
+    warm_prompt_env()
+    await warm_local_models()
+    yield
+    await mcp_pool.aclose()
+    # stop the embedding/generation micro-batch workers
+    await aclose_batchers()
+    await engine.dispose()
+    log_listener.stop()
+
+app = FastAPI(title="Your App with Auth + RAG", lifespan=lifespan)
+
+# CORS configuration. Auth is a bearer token, not a cookie, so a wildcard origin needs no
+# credentials; that lets Starlette send a static "*" instead of echoing each request's Origin.
+# Credentials are only allowed for an explicit origin list.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=settings.cors_origins,
+    allow_credentials="*" not in settings.cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -73,28 +109,13 @@ app.add_middleware(
 app.include_router(auth_router)
 app.include_router(admin_router)
 
-# User management routes (only superusers)
-app.include_router(
-    fastapi_users.get_users_router(UserRead, UserUpdate),
-    prefix="/users",
-    tags=["users"],
-    dependencies=[Depends(current_superuser)],
-)
-
 # Public RAG endpoints
 app.include_router(rag_router)
 
-# Protected Tavily endpoints (requires active user)
-app.include_router(
-    tavily_router,
-    dependencies=[Depends(current_verified)],
-)
-
-# Protected Agent endpoints (requires active + verified user)
-app.include_router(
-    agent_router,
-    dependencies=[Depends(current_verified)],
-)
+# Protected Tavily and Agent endpoints; both routers already require an active, verified user
+# via the shared guard from app.auth.deps, so no second guard is stacked on at include time
+app.include_router(tavily_router)
+app.include_router(agent_router)
 
 @app.get("/")
 async def health_check():
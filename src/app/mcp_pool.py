@@ -0,0 +1,253 @@
+"""
+mcp_pool.py
+
+This module provides a process-wide pool of connected MCP (Model Context Protocol) servers for the agent
+endpoints of a microservices-based FastAPI application.
+
+Overview:
+---------
+- Connecting an `MCPServerSse` costs an SSE handshake, session initialization and a tool-list round-trip.
+  Doing that for every agent request adds one or more round-trips per tool provider to each `ask()`.
+- `MCPServerPool` keeps connected servers open across requests, keyed by their connection parameters
+  (URL and headers). Servers built with the same parameters share one live session, while servers
+  carrying per-user credentials get their own.
+- Each pooled server is owned by a dedicated background task that connects it, prefetches its tool list,
+  pings it periodically and reconnects it if the ping fails. The same task closes it on shutdown, since
+  MCP sessions must be torn down from the task that opened them.
+
+Key Features:
+-------------
+- **Warm Connections:** `startup()` connects every enabled provider in `STATELESS_TOOL_PROVIDERS`,
+  so even the first agent request skips the handshake.
+- **Stateless Fast Path:** `get_provider()` keys stateless providers by name alone, so requests reuse
+  their connection without even building a throwaway server object to fingerprint.
+- **Cached Tool Schemas:** Servers are created with `cache_tools_list=True` and their tool list is fetched
+  once on connect, so agent runs do not re-list tools.
+- **Health Checking:** Dropped sessions are detected by ping and re-established in the background.
+- **Bounded Size:** At most `max_size` servers are kept; the least recently used one is evicted on overflow
+  and closed `evict_grace` seconds later, so agent runs that already checked it out can finish with it.
+
+Intended Usage:
+---------------
+    mcp_pool = MCPServerPool(max_size=256, health_interval=30.0, evict_grace=300.0)
+
+    # FastAPI lifespan
+    await mcp_pool.startup(settings)
+    ...
+    await mcp_pool.aclose()
+
+    # per request
+    server = await mcp_pool.get_provider("firecrawl", settings, current_user)
+
+Dependencies:
+-------------
+- asyncio, logging (Python standard library)
+- openai-agents MCP server classes
+- Project tool provider registry and settings
+
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+
+from app.config import Settings
+from app.registry import STATELESS_TOOL_PROVIDERS, TOOL_PROVIDERS
+
+logger = logging.getLogger(__name__)
+
+def _fingerprint(server) -> tuple:
+    # Two servers are interchangeable when they talk to the same endpoint with the same headers
+    params = getattr(server, "params", {}) or {}
+    headers = tuple(sorted((params.get("headers") or {}).items()))
+    return (server.name, params.get("url"), params.get("messages_path"), headers)
+
+class _PooledServer:
+    """
+    An MCP server kept connected by its own background task.
+    """
+
+    def __init__(self, server, health_interval: float):
+        self.server = server
+        self.health_interval = health_interval
+        self.ready = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self.task = asyncio.create_task(self._run())
+
+    async def _connect(self) -> None:
+        await self.server.connect()
+        # Prime the tool-list cache so agent runs don't have to ask again
+        await self.server.list_tools()
+
+    async def _run(self) -> None:
+        try:
+            await self._connect()
+        except Exception as e:
+            self.ready.set_exception(e)
+            return
+        self.ready.set_result(self.server)
+
+        try:
+            while not self._stop.is_set():
+                try:
+                    await asyncio.wait_for(self._stop.wait(), self.health_interval)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+                try:
+                    await self.server.session.send_ping()
+                except Exception as e:
+                    logger.warning("MCP server '%s' dropped (%s); reconnecting", self.server.name, e)
+                    await self.server.cleanup()
+                    self.server.invalidate_tools_cache()
+                    await self._connect()
+        except Exception as e:
+            logger.error("MCP server '%s' could not reconnect", self.server.name, exc_info=e)
+        finally:
+            await self.server.cleanup()
+
+    @property
+    def alive(self) -> bool:
+        return not self.task.done()
+
+    async def close(self) -> None:
+        self._stop.set()
+        await self.task
+
+class MCPServerPool:
+    """
+    Process-wide pool of connected MCP servers, shared across agent requests.
+
+    Attributes:
+        max_size (int): Maximum number of servers kept connected.
+        health_interval (float): Seconds between health pings of each server.
+        evict_grace (float): Seconds an evicted server stays open for runs still using it.
+    """
+
+    def __init__(self, max_size: int = 256, health_interval: float = 30.0, evict_grace: float = 300.0):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size (int): Maximum number of pooled servers. Defaults to 256.
+            health_interval (float): Seconds between health pings. Defaults to 30.0.
+            evict_grace (float): Delay before an evicted server is closed. Defaults to 300.0.
+        """
+
+        self.max_size = max_size
+        self.health_interval = health_interval
+        self.evict_grace = evict_grace
+        self._servers: OrderedDict[tuple, _PooledServer] = OrderedDict()
+        # pending closes of evicted servers; referenced here so they are not garbage-collected
+        self._closing: set[asyncio.Task] = set()
+
+    async def get(self, server):
+        """
+        Return a connected server equivalent to `server`, connecting it if needed.
+
+        Args:
+            server: A freshly built, unconnected MCP server (e.g. from `TOOL_PROVIDERS`).
+
+        Returns:
+            The pooled, connected MCP server to pass to the agent.
+
+        Raises:
+            Exception: Whatever `connect()` raised if the server could not be reached.
+        """
+
+        return await self._checkout(_fingerprint(server), lambda: server)
+
+    async def get_provider(self, provider: str, settings: Settings, user=None):
+        """
+        Return the connected server for tool provider `provider`, building it only if needed.
+
+        Stateless providers are pooled under their name, so a pool hit builds nothing; others are
+        built for `user` and pooled by their connection parameters, as in `get`.
+
+        Args:
+            provider (str): Key of the provider in `TOOL_PROVIDERS`.
+            settings (Settings): Application settings passed to the provider factory.
+            user: The requesting user, for providers that need per-user credentials.
+
+        Returns:
+            The pooled, connected MCP server to pass to the agent.
+
+        Raises:
+            Exception: Whatever `connect()` raised if the server could not be reached.
+        """
+
+        factory = TOOL_PROVIDERS[provider]
+        if provider not in STATELESS_TOOL_PROVIDERS:
+            return await self.get(factory(settings, user))
+        return await self._checkout(("provider", provider), lambda: factory(settings, None))
+
+    async def _checkout(self, key: tuple, build):
+        pooled = self._servers.get(key)
+        if pooled is None or not pooled.alive:
+            pooled = _PooledServer(build(), self.health_interval)
+            self._servers[key] = pooled
+            self._evict()
+        self._servers.move_to_end(key)
+
+        ready = pooled.ready
+        if ready.done() and ready.exception() is None:
+            # Already connected: a pool hit returns without suspending or wrapping a shield
+            return ready.result()
+
+        try:
+            return await asyncio.shield(ready)
+        except Exception:
+            # Don't keep failed connections around; the next request retries
+            if self._servers.get(key) is pooled:
+                del self._servers[key]
+            raise
+
+    def _evict(self) -> None:
+        while len(self._servers) > self.max_size:
+            _, oldest = self._servers.popitem(last=False)
+            task = asyncio.create_task(self._close_later(oldest))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _close_later(self, pooled: _PooledServer) -> None:
+        # Checkouts carry no release, so an agent run that got this server before it was
+        # evicted may still be calling its tools; give such runs time to finish
+        try:
+            await asyncio.sleep(self.evict_grace)
+        finally:
+            # also reached when aclose() cancels the wait, so shutdown closes it right away
+            await pooled.close()
+
+    async def startup(self, settings: Settings) -> None:
+        """
+        Connect every enabled stateless tool provider.
+
+        Providers needing user credentials are connected on first request. Failures are
+        logged and left for the first request to retry.
+
+        Args:
+            settings (Settings): Application settings listing the enabled tool providers.
+        """
+
+        providers = [
+            key for key in settings.tool_providers
+            if key in TOOL_PROVIDERS and key in STATELESS_TOOL_PROVIDERS
+        ]
+        results = await asyncio.gather(
+            *(self.get_provider(key, settings) for key in providers),
+            return_exceptions=True,
+        )
+        for key, result in zip(providers, results):
+            if isinstance(result, Exception):
+                logger.warning("Could not warm MCP server '%s': %s", key, result)
+
+    async def aclose(self) -> None:
+        """
+        Close every pooled server session, including evicted ones still in their grace period.
+        """
+
+        pooled, self._servers = list(self._servers.values()), OrderedDict()
+        closing = list(self._closing)
+        for task in closing:
+            task.cancel()
+        await asyncio.gather(*(p.close() for p in pooled), *closing, return_exceptions=True)
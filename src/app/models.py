@@ -33,7 +33,7 @@ Dependencies:
 -------------
 - SQLAlchemy ORM (async or sync compatible)
 - FastAPI-Users (for advanced user CRUD/auth management)
-- Python standard library: secrets (for salt generation)
+- Python standard library: os (for salt generation)
 
 Security Considerations:
 ------------------------
@@ -42,7 +42,7 @@ Security Considerations:
 
 """
 
-import secrets
+import os
 import sqlalchemy as sa
 from sqlalchemy.orm import declarative_base
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID
@@ -50,8 +50,8 @@ from fastapi_users.db import SQLAlchemyBaseUserTableUUID
 Base = declarative_base()
 
 def generate_salt() -> str:
-    # 32-byte hex string
-    return secrets.token_hex(16)
+    # 32-char hex string; what secrets.token_hex(16) returns, without its wrapper calls
+    return os.urandom(16).hex()
 
 
 class User(SQLAlchemyBaseUserTableUUID, Base):
@@ -78,3 +78,11 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     openai_api_key = sa.Column(sa.String(255), nullable=True)
     tavily_api_key = sa.Column(sa.String(255), nullable=True)
     firecrawl_api_key = sa.Column(sa.String(255), nullable=True)
+
+    __table_args__ = (
+        # keyset pagination over pending users (/admin/pending); only pending rows are indexed
+        sa.Index("ix_users_pending", "id", postgresql_where=sa.text("is_active = false")),
+        # fastapi-users looks users up by lower(email) on every login, which the plain
+        # unique index on email cannot serve
+        sa.Index("ix_users_email_lower", sa.text("lower(email)")),
+    )
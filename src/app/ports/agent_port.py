@@ -8,7 +8,8 @@ agent-like backend services.
 
 Overview:
 ---------
-- Contains the `AgentPort` abstract base class, specifying the asynchronous `ask` method signature.
+- Contains the `AgentPort` abstract base class, specifying the asynchronous `ask` method signature
+  and a `stream` method that yields the response incrementally as it is generated.
 - Designed for use with the ports-and-adapters (hexagonal) architecture common in microservices—
   adapters implementing this interface can be easily swapped, mocked, or extended, supporting
   both internal and external agent implementations (e.g., OpenAI, Rasa, in-house logic).
@@ -37,7 +38,7 @@ Dependencies:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
 
 class AgentPort(ABC):
     """
@@ -46,6 +47,8 @@ class AgentPort(ABC):
     Methods:
         ask(query: str) -> Any:
             Asynchronously process a user query and return the agent's response.
+        stream(query: str) -> AsyncIterator[str]:
+            Asynchronously yield chunks of the agent's response as they are produced.
     """
 
     @abstractmethod
@@ -59,4 +62,19 @@ class AgentPort(ABC):
         Returns:
             Any: The agent's response to the query.
         """
-        ...
\ No newline at end of file
+        ...
+
+    async def stream(self, query: str) -> AsyncIterator[str]:
+        """
+        Asynchronously yield the response to a user query as it is produced.
+
+        The default implementation yields the full `ask` result as a single chunk;
+        adapters whose backend supports streaming should override it.
+
+        Args:
+            query (str): The user's input query.
+
+        Yields:
+            str: Successive chunks of the agent's response.
+        """
+        yield str(await self.ask(query))
@@ -8,7 +8,8 @@ adapters, enabling decoupled, extensible integration of various embedding provid
 
 Overview:
 ---------
-- Declares the `EmbeddingPort` abstract base class with the asynchronous method `embed_query`.
+- Declares the `EmbeddingPort` abstract base class with the asynchronous method `embed_query`,
+  plus `embed_queries` for batches, which adapters can override with a native batch call.
 - Adheres to the ports-and-adapters (hexagonal) architecture, enhancing replaceability
   and clean boundaries between domain logic and infrastructure in microservices.
 
@@ -33,9 +34,11 @@ Intended Usage:
 Dependencies:
 -------------
 - abc (Python standard library, for abstract base classes)
+- asyncio (Python standard library, for the default batch implementation)
 
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 
 class EmbeddingPort(ABC):
@@ -45,6 +48,8 @@ class EmbeddingPort(ABC):
     Methods:
         embed_query(text: str) -> list[float]:
             Asynchronously generate an embedding vector for the given text query.
+        embed_queries(texts: list[str]) -> list[list[float]]:
+            Asynchronously generate embedding vectors for several texts.
     """
     
     @abstractmethod
@@ -59,3 +64,18 @@ class EmbeddingPort(ABC):
             list[float]: The embedding vector representation of the input text.
         """
         ...
+
+    async def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        Asynchronously generate embedding vectors for several texts.
+
+        The default implementation embeds each text concurrently via `embed_query`;
+        adapters whose backend accepts batched input should override it.
+
+        Args:
+            texts (list[str]): The input texts to embed.
+
+        Returns:
+            list[list[float]]: One embedding vector per input text, in input order.
+        """
+        return list(await asyncio.gather(*map(self.embed_query, texts)))
@@ -11,7 +11,7 @@ Overview:
 
 Key Features:
 -------------
-- **Abstract CRUD Operations:** Enforces a standard interface for user creation, retrieval by email or ID, and user update, ensuring consistency across all user data sources.
+- **Abstract CRUD Operations:** Enforces a standard interface for user creation (single or bulk), retrieval by email or ID, and user update, ensuring consistency across all user data sources.
 - **Asynchronous Execution:** All repository methods are async, providing non-blocking, scalable I/O suitable for modern, distributed microservices ecosystems.
 - **Testability and Swap-ability:** Supports mocking and fake implementations, making testing, local development, and future backend migrations straightforward.
 - **Strong Typing:** Utilizes core domain schemas and models (`User`, `UserCreate`) for type safety and clarity.
@@ -41,6 +41,9 @@ class UserRepositoryPort(ABC):
         create_user(user: UserCreate) -> User:
             Asynchronously create a new user in the repository.
 
+        create_users_bulk(users: list[UserCreate]) -> list[User]:
+            Asynchronously create many users at once, skipping already registered emails.
+
         get_user_by_email(email: str) -> User | None:
             Asynchronously retrieve a user by their email address.
 
@@ -64,6 +67,19 @@ class UserRepositoryPort(ABC):
         """
         ...
     
+    @abstractmethod
+    async def create_users_bulk(self, users: list[UserCreate]) -> list[User]:
+        """
+        Asynchronously create many users in a single batch.
+
+        Args:
+            users (list[UserCreate]): The user creation data.
+
+        Returns:
+            list[User]: The newly created users; emails that already exist are skipped.
+        """
+        ...
+
     @abstractmethod
     async def get_user_by_email(self, email: str) -> User | None:
         """
@@ -10,6 +10,7 @@ from agents.mcp.server import MCPServerSse, MCPServerSseParams
 from app.adapters.openai_llm_adapter       import OpenAILLMAdapter
 from app.adapters.hf_llm_adapter           import HfLLMAdapter
 from app.adapters.openai_embedding_adapter import OpenAIEmbeddingAdapter
+from app.adapters.onnx_embedding_adapter   import OnnxEmbeddingAdapter
 from app.adapters.postgres_user_repository import PostgresUserRepository
 from app.adapters.tavily_search_adapter    import TavilySearchAdapter
 
@@ -20,6 +21,7 @@ LLM_PROVIDERS = {
 
 EMBEDDING_PROVIDERS = {
     "openai": OpenAIEmbeddingAdapter,
+    "onnx":   OnnxEmbeddingAdapter,
 }
 
 USER_REPOSITORY_PROVIDERS = {
@@ -33,6 +35,10 @@ TAVILY_SEARCH_PROVIDERS = {
     )
 }
 
+# Tool servers that carry no per-user credentials: every user shares one pooled connection,
+# and the server object is only built when that connection has to be (re)opened
+STATELESS_TOOL_PROVIDERS = frozenset({"calculator"})
+
 TOOL_PROVIDERS: dict[str, Callable[[Settings, Optional[User]], object]] = {
     "calculator": lambda s, user=None: MCPServerSse(
         params=MCPServerSseParams(
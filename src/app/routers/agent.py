@@ -18,6 +18,8 @@ Key Features:
   limiting access to trusted users and protecting sensitive AI/agent capabilities.
 - **Agent Query Submission:** The `/agent/ask` endpoint accepts structured queries (`AgentRequest`), passes them to a pluggable agent service,
   and returns AI-generated or logic-derived responses in a standardized response schema (`AgentResponse`).
+- **Streaming Responses:** The `/agent/stream` endpoint returns the same answer as Server-Sent Events,
+  one event per generated chunk, so clients see the first tokens as soon as they are produced.
 - **Service-Oriented and Extensible:** The design is modular, with agent logic abstracted in an injected service (`AgentService`),
   facilitating future enhancement, testing, or backend swaps.
 - **Robust Error Handling:** All errors (other than HTTPExceptions) are caught and reported as HTTP 503 responses,
@@ -44,15 +46,16 @@ leakage of internal errors or stack traces.
 
 """
 
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from app.dependencies import get_agent_service
 from app.schemas import AgentRequest, AgentResponse
 from app.services.agent_service import AgentService
-from app.auth.router import fastapi_users
-
 # Require an authenticated, active AND verified user for all /agent endpoints
-current_active_verified = fastapi_users.current_user(active=True, verified=True)
+from app.auth.deps import current_verified_user as current_active_verified
 
 router = APIRouter(
     prefix="/agent",
@@ -91,4 +94,46 @@ async def ask_agent(
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Agent failed with error: {e}",
-        )
\ No newline at end of file
+        )
+
+
+def _sse_event(data: str, event: str | None = None) -> str:
+    # every line of the payload needs its own "data:" field
+    lines = [f"event: {event}"] if event else []
+    lines += [f"data: {line}" for line in data.split("\n")]
+    return "\n".join(lines) + "\n\n"
+
+
+@router.post("/stream")
+async def stream_agent(
+    req: AgentRequest,
+    svc: AgentService = Depends(get_agent_service),
+    user=Depends(current_active_verified),
+):
+    """
+    Submit a query to the agent and stream its response as Server-Sent Events.
+
+    Each generated chunk is sent as one `data` event; an `error` event is sent if the
+    agent fails mid-stream, since the status code has already been committed by then.
+
+    Args:
+        req (AgentRequest): The request object containing the user's query.
+        svc (AgentService): Dependency-injected agent service for handling queries.
+        user: The currently authenticated and verified user.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` response of response chunks.
+    """
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for chunk in svc.stream(req.query):
+                yield _sse_event(chunk)
+        except Exception as e:
+            yield _sse_event(f"Agent failed with error: {e}", event="error")
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -6,6 +6,8 @@ leveraging the fastapi-users library to provide secure, extensible user workflow
 
 Overview:
 ---------
+- Re-exports the single authentication setup defined in `app.auth.router` (router, JWT backend, `fastapi_users` instance),
+  so importing from either module yields the same objects and never registers a second backend or a second copy of the routes.
 - Implements secure JWT authentication using a configurable secret key and token lifetime, with tokens transported via Bearer headers.
 - Orchestrates fastapi-users’ high-level abstractions for user registration, authentication, email verification, password resets, and user profile management. 
 - Uses reusable and dependency-injectable user database access, easily swappable to target different databases or mock stores.
@@ -37,65 +39,12 @@ Security Considerations:
 
 """
 
-import uuid
-from fastapi import APIRouter
-from fastapi_users import FastAPIUsers
-from fastapi_users.authentication import AuthenticationBackend, BearerTransport, JWTStrategy
-
-from app.db.user import get_user_db
-from app.models import User
-from app.schemas import UserCreate, UserRead, UserUpdate
-from app.config import settings
-
-router = APIRouter()
-
-# How the token is transported
-bearer_transport = BearerTransport(tokenUrl="auth/jwt/login")
-
-# JWT strategy
-def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(secret=settings.SECRET_KEY, lifetime_seconds=3600)
-
-# Authentication backend
-auth_backend = AuthenticationBackend(
-    name="jwt",
-    transport=bearer_transport,
-    get_strategy=get_jwt_strategy,
-)
-
-# FastAPI-Users instance
-fastapi_users = FastAPIUsers[User, uuid.UUID](
-    get_user_db,
-    [auth_backend],
-    User,
-    UserCreate,
-    UserRead,
-    UserUpdate,
+from app.auth.router import (
+    auth_backend,
+    bearer_transport,
+    fastapi_users,
+    get_jwt_strategy,
+    router,
 )
 
-# Mount the built-in FastAPI-Users routers
-router.include_router(
-    fastapi_users.get_register_router(UserCreate, UserRead),
-    prefix="/auth",
-    tags=["auth"],
-)
-router.include_router(
-    fastapi_users.get_verify_router(UserRead),
-    prefix="/auth",
-    tags=["auth"],
-)
-router.include_router(
-    fastapi_users.get_auth_router(auth_backend),
-    prefix="/auth/jwt",
-    tags=["auth"],
-)
-router.include_router(
-    fastapi_users.get_reset_password_router(),
-    prefix="/auth",
-    tags=["auth"],
-)
-router.include_router(
-    fastapi_users.get_users_router(UserRead, UserUpdate),
-    prefix="/users",
-    tags=["users"],
-)
+__all__ = ["auth_backend", "bearer_transport", "fastapi_users", "get_jwt_strategy", "router"]
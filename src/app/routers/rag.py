@@ -54,10 +54,8 @@ from app.services.retrieval_service import RetrievalService
 from app.services.llm_service import LLMService
 from app.dependencies import get_llm_provider, get_embedding_provider
 from app.db.core import get_db
-from app.auth.router import fastapi_users
-
 # Only allow active, verified users
-current_active_user = fastapi_users.current_user(active=True, verified=True)
+from app.auth.deps import current_verified_user as current_active_user
 
 router = APIRouter(
     prefix="/rag",
@@ -38,10 +38,9 @@ from app.dependencies import get_tavily_adapter, get_tavily_summary_service
 from app.ports.tavily_search_port import TavilySearchPort
 from app.services.tavily_summarize_service import TavilySummaryService
 from app.schemas import ContextItem, SummarizeRequest, SummarizeResponse
-from app.auth.router import fastapi_users
+from app.auth.deps import current_verified_user as current_active_user
 
 logger = logging.getLogger(__name__)
-current_active_user = fastapi_users.current_user(active=True, verified=True)
 
 router = APIRouter(
     prefix="/tavily",
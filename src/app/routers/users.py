@@ -39,7 +39,9 @@ Security Considerations:
 
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+
+from fastapi import APIRouter, Depends, status
 from ..schemas import UserCreate, UserRead, UserUpdate
 from ..services.user_service import UserService
 from ..dependencies import get_user_service
@@ -55,8 +57,8 @@ async def register_user(
     """
     Register a new user if the email address is not already taken.
 
-    Checks for an existing user with the provided email and, if not found,
-    delegates user creation to the user service.
+    Delegates user creation to the user service, whose single
+    `INSERT ... ON CONFLICT (email) DO NOTHING` also detects duplicates.
 
     Args:
         user_in (UserCreate): The information required to create a new user.
@@ -69,12 +71,6 @@ async def register_user(
         HTTPException: If the email is already registered.
     """
 
-    # Optionally check for existing:
-    if await user_svc.get_user_by_email(user_in.email):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
     # Delegate creation (including hashing) to your service
     new_user = await user_svc.create_user(user_in)
     return new_user
@@ -121,7 +117,7 @@ async def update_profile(
 
     # Apply each change dynamically:
     if "password" in changes:
-        changes["hashed_password"] = hash_password(changes.pop("password"))
+        changes["hashed_password"] = await asyncio.to_thread(hash_password, changes.pop("password"))
 
     for field, value in changes.items():
         setattr(current_user, field, value)
@@ -18,7 +18,7 @@ Key Features:
 - **Token and Security Schemas:** Token and TokenData withstand changes in JWT or OAuth2 security implementations, supporting decoupled and flexible authentication flows.
 - **Summarization and RAG:** Defines input/output structures (SummarizeRequest, SummarizeResponse, ContextItem) ensuring repeatable, well-typed RAG and summarization pipelines.
 - **AI Agent Interaction:** AgentRequest and AgentResponse provide clear models for conversational/agent endpoints, supporting generic, AI-driven microservices.
-- **ORM Compatibility:** UserRead and related models use `orm_mode = True` to allow seamless integration with SQLAlchemy ORM objects and database result sets.
+- **ORM Compatibility:** UserRead and related models use `from_attributes=True` to allow seamless integration with SQLAlchemy ORM objects and database result sets.
 
 Usage:
 ------
@@ -41,7 +41,7 @@ Security & Best Practices:
 
 import uuid
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from fastapi_users import schemas as _fu_schemas
 
 # Use UUID as the primary key type
@@ -60,8 +60,19 @@ class UserRead(_fu_schemas.BaseUser[ID]):
     tavily_api_key: Optional[str] = None
     firecrawl_api_key: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+class UserPage(BaseModel):
+    """
+    Schema for one page of a keyset-paginated user listing.
+
+    Attributes:
+        items (List[UserRead]): The users on this page, ordered by id.
+        next_cursor (Optional[UUID]): Pass as `after` to fetch the next page; None on the last page.
+    """
+
+    items: List[UserRead]
+    next_cursor: Optional[ID] = None
 
 class UserCreate(_fu_schemas.BaseUserCreate):
     """
@@ -14,6 +14,7 @@ Overview:
 Key Features:
 -------------
 - **Secure Password Management:** Passwords are never stored or transmitted as plaintext. They are always hashed and verified using a robust, industry-standard hash context.
+- **Uniform Hashing Cost:** One bcrypt context with an explicit cost (`bcrypt_rounds`) backs both these helpers and fastapi-users' `password_helper`, and hashing runs on `password_executor`, a thread pool sized for login bursts.
 - **Robust JWT Support:** Access tokens are issued as signed JWTs with configurable expiration, using project credentials for payload integrity.
 - **OAuth2 Bearer Compliance:** Follows OAuth2PasswordBearer standards, integrating cleanly with frontend, mobile clients, and other microservices needing delegated auth.
 - **Database-Backed User Checks:** The `get_current_user` dependency retrieves user details directly from the async SQLAlchemy backend, guaranteeing fresh, up-to-date identity checks.
@@ -27,7 +28,7 @@ Usage:
 
 Dependencies:
 -------------
-- jose (JWT encryption/signing)
+- PyJWT (JWT signing/verification; the same library fastapi-users signs its tokens with)
 - passlib (password hashing)
 - FastAPI & SQLAlchemy (dependency & session management)
 - Project config, models, and schemas
@@ -40,10 +41,13 @@ Security & Best Practices:
 
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from fastapi_users.password import PasswordHelper
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.core import get_db
@@ -52,7 +56,16 @@ from .models import User
 from .schemas import TokenData
 from sqlalchemy.future import select
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
+# shared with fastapi-users' UserManager, so registration and login hash at the same cost
+password_helper = PasswordHelper(pwd_context)
+
+# bcrypt is CPU-bound and releases the GIL; the app lifespan installs this pool as the loop's
+# default executor, so every asyncio.to_thread(...) hash or verify runs here, cpu_count * 2 wide
+password_executor = ThreadPoolExecutor(
+    max_workers=(os.cpu_count() or 1) * 2,
+    thread_name_prefix="pw",
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 def hash_password(password: str) -> str:
@@ -127,7 +140,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
         user_id: str = payload.get("sub")
         if not user_id:
             raise credentials_exception
-    except JWTError:
+    except jwt.PyJWTError:
         raise credentials_exception
 
     result = await db.execute(select(User).where(User.id == user_id))
@@ -15,7 +15,7 @@ Key Features:
 -------------
 - **Adapter Abstraction:** Receives any implementation of `AgentPort`, delegating query resolution transparently.
 - **Async-Ready:** Asynchronous by design, supporting high-concurrency FastAPI microservice endpoints and background workers.
-- **Domain-Oriented Service:** Presents a simple, business-focused interface (`ask`) that can be orchestrated by higher-level application or orchestration code.
+- **Domain-Oriented Service:** Presents a simple, business-focused interface (`ask`, plus `stream` for incremental output) that can be orchestrated by higher-level application or orchestration code.
 
 Intended Usage:
 ---------------
@@ -33,6 +33,8 @@ Testability:
 
 """
 
+from typing import AsyncIterator
+
 from app.ports.agent_port import AgentPort
 
 class AgentService:
@@ -47,6 +49,8 @@ class AgentService:
     Methods:
         ask(query: str) -> str:
             Asynchronously process a query using the agent adapter and return the response.
+        stream(query: str) -> AsyncIterator[str]:
+            Asynchronously yield the agent's response in chunks as it is generated.
     """
 
     def __init__(self, adapter: AgentPort):
@@ -71,3 +75,17 @@ class AgentService:
         """
         
         return await self.adapter.ask(query)
+
+    async def stream(self, query: str) -> AsyncIterator[str]:
+        """
+        Submit a query to the agent and yield the response as it is generated.
+
+        Args:
+            query (str): The query string to process.
+
+        Yields:
+            str: Successive chunks of the agent's response.
+        """
+
+        async for chunk in self.adapter.stream(query):
+            yield chunk
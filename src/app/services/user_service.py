@@ -43,6 +43,8 @@ Security Considerations:
 
 """
 
+import asyncio
+
 from app.schemas import UserCreate, UserUpdate
 from app.models import User
 
@@ -54,6 +56,10 @@ class UserService:
         # forward the Pydantic model directly
         return await self.repo.create_user(user_create)
 
+    async def create_users_bulk(self, users: list[UserCreate]) -> list[User]:
+        # one INSERT and one commit for the whole batch
+        return await self.repo.create_users_bulk(users)
+
     async def get_user_by_email(self, email: str) -> User | None:
         return await self.repo.get_user_by_email(email)
     
@@ -68,7 +74,8 @@ class UserService:
         if user_update.password is not None:
             # hash here or assume already hashed
             from app.security import hash_password
-            user.hashed_password = hash_password(user_update.password)
+            # bcrypt is CPU-bound; keep it off the event loop
+            user.hashed_password = await asyncio.to_thread(hash_password, user_update.password)
         if user_update.openai_api_key is not None:
             user.openai_api_key = user_update.openai_api_key
         if user_update.tavily_api_key is not None: